@@ -0,0 +1,10 @@
+"""
+스킬 헬퍼 스크립트 공용 정규식
+
+validate_issue_key.py / make_branch_name.py 가 같은 패턴을 쓰도록 한 곳에서 정의합니다.
+패턴에 앵커(^, $)가 없으므로 반드시 fullmatch() 로 사용합니다.
+"""
+
+import re
+
+ISSUE_KEY_RE = re.compile(r"([A-Z][A-Z0-9]+)-(\d+)")
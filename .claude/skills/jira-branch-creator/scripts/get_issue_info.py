@@ -28,21 +28,17 @@ import urllib.request
 
 
 ALLOWED_PROJECT = "SSCVE"
+REQUIRED_ENV    = ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN")
 
 
 def check_env() -> tuple[str, str, str]:
-    errors = []
-    url   = os.environ.get("JIRA_BASE_URL", "")
-    email = os.environ.get("JIRA_EMAIL", "")
-    token = os.environ.get("JIRA_API_TOKEN", "")
-    if not url:   errors.append("JIRA_BASE_URL")
-    if not email: errors.append("JIRA_EMAIL")
-    if not token: errors.append("JIRA_API_TOKEN")
-    if errors:
-        print(f"❌ Missing env vars: {', '.join(errors)}", file=sys.stderr)
+    env     = os.environ
+    missing = [k for k in REQUIRED_ENV if not env.get(k)]
+    if missing:
+        print(f"❌ Missing env vars: {', '.join(missing)}", file=sys.stderr)
         print("   Run setup.ps1 (Windows) or setup.sh (macOS/Linux)", file=sys.stderr)
         sys.exit(1)
-    return url, email, token
+    return tuple(env[k] for k in REQUIRED_ENV)
 
 
 def fetch_issue(base_url: str, email: str, token: str, key: str) -> dict:
@@ -54,7 +50,7 @@ def fetch_issue(base_url: str, email: str, token: str, key: str) -> dict:
     })
     try:
         with urllib.request.urlopen(req) as resp:
-            data = json.loads(resp.read().decode())
+            data = json.load(resp)
         return {
             "key":     data["key"],
             "type":    data["fields"]["issuetype"]["name"],
@@ -13,12 +13,12 @@ Exit codes:
     1 - 인수 오류
 """
 
-import re
 import sys
 
+from _patterns import ISSUE_KEY_RE
+
 
 ALLOWED_PROJECT = "SSCVE"
-ISSUE_KEY_RE    = re.compile(r"^([A-Z][A-Z0-9]+)-(\d+)$")
 
 
 def make_branch_name(issue_key: str) -> str:
@@ -33,7 +33,7 @@ if __name__ == "__main__":
 
     key = sys.argv[1].strip().upper()
 
-    if not ISSUE_KEY_RE.match(key):
+    if not ISSUE_KEY_RE.fullmatch(key):
         print(f"Invalid issue key format: '{key}' (expected: SSCVE-123)", file=sys.stderr)
         sys.exit(1)
 
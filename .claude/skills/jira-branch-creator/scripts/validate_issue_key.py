@@ -11,17 +11,17 @@ Exit codes:
     1 - 형식 오류 또는 SSCVE 외 프로젝트 키
 """
 
-import re
 import sys
 
+from _patterns import ISSUE_KEY_RE
+
 ALLOWED_PROJECT = "SSCVE"
-ISSUE_KEY_RE    = re.compile(r"^([A-Z][A-Z0-9]+)-(\d+)$")
 
 
 def validate(key: str) -> tuple[bool, str]:
     """(ok, message) 반환"""
     key = key.strip().upper()
-    m   = ISSUE_KEY_RE.match(key)
+    m   = ISSUE_KEY_RE.fullmatch(key)
 
     if not m:
         return False, f"❌ Invalid issue key format: '{key}' (expected: SSCVE-123)"
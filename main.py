@@ -14,10 +14,12 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from typing import TYPE_CHECKING
 
-from jira_branch_creator.config import load_config
 from jira_branch_creator.exceptions import JiraBranchCreatorError
-from jira_branch_creator.facades.workflow_facade import WorkflowFacade
+
+if TYPE_CHECKING:
+    from jira_branch_creator.facades.workflow_facade import WorkflowFacade
 
 
 def _setup_logging(verbose: bool) -> None:
@@ -99,6 +101,15 @@ def _handle_transitions(facade: WorkflowFacade, args: argparse.Namespace) -> Non
         print("  (전환 가능한 상태 없음)")
 
 
+_HANDLERS = {
+    "branch": _handle_branch,
+    "create": _handle_create,
+    "transition": _handle_transition,
+    "preview": _handle_preview,
+    "transitions": _handle_transitions,
+}
+
+
 # ─── CLI 파서 ────────────────────────────────────────────────────────────
 
 
@@ -156,19 +167,14 @@ def main() -> None:
     _setup_logging(args.verbose)
 
     try:
+        # 무거운 서비스/HTTP 클라이언트 import는 인자 파싱 이후로 미룸 (--help 등은 즉시 종료)
+        from jira_branch_creator.config import load_config
+        from jira_branch_creator.facades.workflow_facade import WorkflowFacade
+
         config = load_config()
         facade = WorkflowFacade(config)
 
-        handlers = {
-            "branch": _handle_branch,
-            "create": _handle_create,
-            "transition": _handle_transition,
-            "preview": _handle_preview,
-            "transitions": _handle_transitions,
-        }
-
-        handler = handlers[args.command]
-        handler(facade, args)
+        _HANDLERS[args.command](facade, args)
 
     except JiraBranchCreatorError as e:
         print(f"\n❌ {e}", file=sys.stderr)
@@ -0,0 +1,331 @@
+"""
+scripts/ 공용 Jira 클라이언트 + 로거
+
+sync_intqa_to_sscve.py / create_branches_from_sscve.py / sync_and_create_branches.py 가
+같은 연결/속도 제한/로그 포맷을 쓰도록 한 곳에서 정의합니다.
+
+  - 환경변수 검사:  check_env()
+  - 로거:           setup_logger(log_prefix), logger, log_ok(), log_skip(), flush_console()
+  - Jira REST:      jira_get(), jira_post(), jira_search()
+
+Python 3.10+ 필요
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import json
+import base64
+import gzip
+import logging
+import threading
+import time
+import http.client
+import urllib.parse
+from datetime import datetime
+from pathlib import Path
+from typing import Sequence
+
+# 콘솔 출력은 블록 버퍼링 - 레코드마다가 아니라 flush_console()/ERROR/종료 시점에만 내보냄
+sys.stdout.reconfigure(encoding="utf-8", line_buffering=False)
+
+
+# ─── 설정 ────────────────────────────────────────────────────────────────────
+
+REQUIRED = ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN")
+
+JIRA_URL     = os.environ.get("JIRA_BASE_URL", "")
+EMAIL        = os.environ.get("JIRA_EMAIL", "")
+TOKEN        = os.environ.get("JIRA_API_TOKEN", "")
+
+# 요청마다 base64 인코딩하지 않도록 한 번만 계산 (값이 비어 있으면 check_env()에서 종료됨)
+_AUTH_HEADER = "Basic " + base64.b64encode(f"{EMAIL}:{TOKEN}".encode()).decode()
+
+# JSON 직렬화/파싱 - orjson 이 설치돼 있으면 사용 (bytes 를 그대로 파싱/반환, C 구현이라 큰 검색 응답에서 빠름)
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # 구분자 공백 제거, 한글은 이스케이프 없이 UTF-8 로 전송
+    _encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def _dumps(obj: object) -> bytes:
+        return _encode_json(obj).encode("utf-8")
+
+    _loads = json.loads  # bytes 입력 허용 (UTF-8 자동 판별)
+
+# /search/jql 페이지당 요청 이슈 수 (JIRA_SEARCH_PAGE_SIZE 로 변경 가능).
+# 서버 상한(키만 요청 시 5000)보다 크거나 필드가 많으면 서버가 줄여서 반환하고 nextPageToken 으로 이어 받음
+SEARCH_PAGE_SIZE    = int(os.environ.get("JIRA_SEARCH_PAGE_SIZE", "1000"))
+JIRA_MAX_RPS        = 10.0  # 초당 최대 요청 수 (응답의 X-RateLimit-* 헤더가 있으면 그 값으로 갱신)
+RETRY_AFTER_DEFAULT = 5     # 429 응답에 Retry-After 가 없거나 해석 불가할 때 대기 초
+
+_DEFAULT_LOG_DIR = Path.home() / "Desktop" / "jira-sync-logs"
+LOG_DIR          = Path(os.environ.get("LOG_DIR") or _DEFAULT_LOG_DIR)
+
+
+# ─── 로거 설정 ────────────────────────────────────────────────────────────────
+
+class _LevelFormatter(logging.Formatter):
+    """레벨명을 5자로 패딩: INFO -> INFO , ERROR -> ERROR"""
+    LEVEL_MAP = {
+        "INFO":     "INFO ",
+        "WARNING":  "WARN ",
+        "ERROR":    "ERROR",
+        "CRITICAL": "ERROR",
+        "OK":       "OK   ",
+        "SKIP":     "SKIP ",
+    }
+
+    def __init__(self) -> None:
+        super().__init__()
+        # (초, 포맷된 문자열) - 같은 초에 찍히는 레코드는 strftime 없이 재사용
+        self._last_ts: tuple[int, str] = (-1, "")
+
+    def format(self, record: logging.LogRecord) -> str:
+        level = self.LEVEL_MAP.get(record.levelname, record.levelname[:5].ljust(5))
+        sec   = int(record.created)
+        cached_sec, dt = self._last_ts
+        if sec != cached_sec:
+            dt = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._last_ts = (sec, dt)
+        return f"[{dt}] [{level}] {record.getMessage()}"
+
+
+class _DeferredFlushMixin:
+    """레코드마다 flush 하지 않음 - ERROR 이상이거나 flush()/종료(logging.shutdown) 시에만 내보냄"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+class _BufferedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    """콘솔 핸들러"""
+
+
+class _BufferedFileHandler(_DeferredFlushMixin, logging.FileHandler):
+    """파일 핸들러 (파일명에 실행 일자가 들어가므로 로테이션 검사도 하지 않음)"""
+
+
+OK_LEVEL   = 25
+SKIP_LEVEL = 26
+logging.addLevelName(OK_LEVEL,   "OK")
+logging.addLevelName(SKIP_LEVEL, "SKIP")
+
+# 모든 스크립트가 같은 로거를 공유 - 핸들러는 setup_logger()에서 한 번만 붙임
+logger = logging.getLogger("jira_sync")
+
+
+def setup_logger(log_prefix: str) -> logging.Logger:
+    """콘솔 + LOG_DIR/{log_prefix}_YYYYMMDD.log 핸들러 설정"""
+    if logger.handlers:
+        return logger
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_file = LOG_DIR / f"{log_prefix}_{datetime.now().strftime('%Y%m%d')}.log"
+
+    formatter = _LevelFormatter()
+
+    file_handler = _BufferedFileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+
+    console_handler = _BufferedStreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(file_handler)
+    logger.addHandler(console_handler)
+    return logger
+
+
+def log_ok(msg: str)   -> None: logger.log(OK_LEVEL,   msg)
+def log_skip(msg: str) -> None: logger.log(SKIP_LEVEL, msg)
+
+
+def flush_console() -> None:
+    """버퍼에 쌓인 로그를 내보냄 (오래 걸리는 작업 전후에 호출)"""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+def check_env() -> tuple[str, str, str]:
+    """필수 환경변수 확인 -> (JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN). 누락 시 종료.
+
+    os.environ 을 다시 읽지 않고 import 시 읽어 둔 모듈 상수를 검사한다.
+    """
+    values  = (JIRA_URL, EMAIL, TOKEN)
+    missing = [name for name, value in zip(REQUIRED, values, strict=True) if not value]
+    if missing:
+        logger.error(f"환경변수 누락: {', '.join(missing)}")
+        sys.exit(1)
+    return values
+
+
+# ─── Jira REST ───────────────────────────────────────────────────────────────
+
+class _RateLimiter:
+    """요청 간 최소 간격(1/rate 초)을 지키는 스레드 안전 리미터"""
+
+    def __init__(self, rate: float) -> None:
+        self.rate     = rate
+        self._lock    = threading.Lock()
+        self._next_ok = 0.0
+
+    def acquire(self) -> None:
+        """다음 요청 가능 시각까지 대기 (대기는 락 밖에서 수행)"""
+        with self._lock:
+            now  = time.monotonic()
+            wait = self._next_ok - now
+            self._next_ok = max(now, self._next_ok) + 1 / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, resp: http.client.HTTPResponse) -> None:
+        """X-RateLimit-FillRate / X-RateLimit-Interval-Seconds 헤더로 허용 속도 갱신"""
+        fill     = resp.getheader("X-RateLimit-FillRate")
+        interval = resp.getheader("X-RateLimit-Interval-Seconds")
+        if not (fill and interval):
+            return
+        try:
+            rate = int(fill) / int(interval)
+        except (ValueError, ZeroDivisionError):
+            return
+        if rate > 0:
+            self.rate = rate
+
+
+_rate_limiter = _RateLimiter(JIRA_MAX_RPS)
+
+
+# http.client 연결은 스레드 간 공유 불가 -> 스레드마다 keep-alive 연결 1개
+_jira_local = threading.local()
+
+
+def _jira_connection() -> http.client.HTTPConnection:
+    """현재 스레드의 Jira keep-alive 연결 반환 (TCP/TLS 핸드셰이크는 스레드당 최초 1회만 수행)"""
+    conn = getattr(_jira_local, "conn", None)
+    if conn is None:
+        url = urllib.parse.urlsplit(JIRA_URL)
+        conn_cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        conn = _jira_local.conn = conn_cls(url.netloc, timeout=30)
+    return conn
+
+
+# 응답 대기 중 연결이 끊겨도 다시 보내도 되는 메서드
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _jira_request(
+    method: str, path: str, body: bytes | None = None, retry_safe: bool = False,
+) -> tuple[int, str, bytes]:
+    """keep-alive 연결로 요청 -> (status, reason, raw body)
+
+    요청 전 _rate_limiter 로 속도를 제한한다. 끊긴 연결은 1회 재연결 후 재시도하되,
+    요청을 다 보낸 뒤(응답 대기 중) 끊긴 경우에는 서버가 이미 처리했을 수 있으므로
+    멱등 메서드(_IDEMPOTENT_METHODS)나 retry_safe=True 로 표시한 요청(조회용 POST)만
+    재시도한다 - 이슈/링크 생성 POST 재전송으로 중복 생성되지 않도록.
+    429 응답은 Retry-After 만큼 기다린 뒤 1회 재시도한다.
+    """
+    headers = {
+        "Authorization": _AUTH_HEADER,
+        "Accept":        "application/json",
+        # search/jql 응답 JSON은 5~10배 압축됨 - 전송량 절감
+        "Accept-Encoding": "gzip",
+    }
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+    url_path = urllib.parse.urlsplit(JIRA_URL).path.rstrip("/") + path
+
+    sent = False  # 마지막 send() 가 요청 전송을 마쳤는지
+
+    def send() -> tuple[int, str, bytes, str | None]:
+        nonlocal sent
+        sent = False
+        _rate_limiter.acquire()
+        conn = _jira_connection()
+        conn.request(method, url_path, body=body, headers=headers)
+        sent = True
+        resp = conn.getresponse()
+        raw  = resp.read()
+        _rate_limiter.update(resp)
+        if resp.getheader("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        return resp.status, resp.reason, raw, resp.getheader("Retry-After")
+
+    try:
+        status, reason, raw, retry_after = send()
+    except (ConnectionError, http.client.HTTPException):
+        # 서버가 유휴 keep-alive 연결을 닫은 경우 새 연결로 다시 시도
+        _jira_connection().close()
+        _jira_local.conn = None
+        if sent and not (retry_safe or method in _IDEMPOTENT_METHODS):
+            raise
+        status, reason, raw, retry_after = send()
+
+    if status == 429:
+        try:
+            delay = float(retry_after)
+        except (TypeError, ValueError):
+            delay = RETRY_AFTER_DEFAULT
+        logger.warning(f"요청 한도 초과(429) - {delay:.0f}초 후 재시도")
+        time.sleep(delay)
+        status, reason, raw, _ = send()
+    return status, reason, raw
+
+
+def jira_get(path: str) -> dict | None:
+    try:
+        status, reason, raw = _jira_request("GET", path)
+    except (OSError, http.client.HTTPException) as e:
+        logger.error(f"네트워크 오류: {e}")
+        return None
+    if status >= 400:
+        logger.error(f"API {status} {reason}: {raw.decode()[:300]}")
+        return None
+    return _loads(raw) if raw.strip() else None
+
+
+def jira_post(path: str, payload: dict, retry_safe: bool = False) -> tuple[int, dict | None]:
+    body = _dumps(payload)
+    try:
+        status, reason, raw = _jira_request("POST", path, body, retry_safe=retry_safe)
+    except (OSError, http.client.HTTPException) as e:
+        logger.error(f"네트워크 오류: {e}")
+        return 0, None
+    if status >= 400:
+        logger.error(f"API {status} {reason}: {raw.decode()[:300]}")
+        return status, None
+    return status, _loads(raw) if raw.strip() else None
+
+
+def jira_search(jql: str, fields: Sequence[str]) -> tuple[list[dict], bool]:
+    """/search/jql 결과를 nextPageToken으로 끝까지 페이징 조회 -> (이슈 목록, 완료 여부)
+
+    요청이 실패하면 그때까지 받은 이슈와 False 를 반환한다.
+    빈 목록만으로는 '결과 없음'과 '조회 실패'를 구분할 수 없으므로 호출자는 완료 여부를 확인해야 한다.
+    """
+    payload: dict = {
+        "jql":          jql,
+        "fields":       list(fields),
+        "fieldsByKeys": False,
+        "maxResults":   SEARCH_PAGE_SIZE,
+    }
+    issues: list[dict] = []
+    while True:
+        # /search/jql 은 조회 전용이라 응답 대기 중 연결이 끊겨도 다시 보내도 안전
+        _, data = jira_post("/rest/api/3/search/jql", payload, retry_safe=True)
+        if not data:
+            return issues, False
+        issues.extend(data.get("issues", []))
+        token = data.get("nextPageToken")
+        if data.get("isLast") or not token:
+            return issues, True
+        payload["nextPageToken"] = token
@@ -6,10 +6,12 @@ SSCVE 이슈 -> git flow feature 브랜치 생성 스크립트
 
 중복 방지:
   - 로컬에 이미 존재하는 브랜치는 건너뜀
+  - 직전 실행(PHASE2_CACHE_TTL 초 이내)의 이슈가 모두 로컬 브랜치로 있으면 Jira 조회 자체를 생략
+    (캐시: %USERPROFILE%\\Desktop\\jira-sync-logs\\phase2_cache.json)
 
 로그:
   - 저장 위치: %USERPROFILE%\\Desktop\\jira-sync-logs\\
-  - 파일명: create_branches_YYYYMMDD.log (일별 자동 로테이션)
+  - 파일명: create_branches_YYYYMMDD.log (실행 일자별 파일, 같은 날은 이어쓰기)
   - 포맷: [YYYY-MM-DD HH:MM:SS] [LEVEL] MESSAGE
 
 Usage:
@@ -22,266 +24,279 @@ Usage:
     JIRA_EMAIL       - Jira 로그인 이메일 (필수)
     JIRA_API_TOKEN   - Jira API 토큰 (필수)
 
-Python 3.9+ 필요
+sync_and_create_branches.py 가 이 모듈의 run_phase2() 를 Phase 2 로 그대로 사용합니다.
+
+Python 3.10+ 필요
 """
 
 from __future__ import annotations
 
 import argparse
-import os
-import sys
 import json
-import base64
-import logging
+import os
 import subprocess
-import urllib.request
-import urllib.error
-from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-sys.stdout.reconfigure(encoding="utf-8")
+from _jira_client import (
+    EMAIL, JIRA_URL, LOG_DIR, check_env, flush_console, jira_get, jira_search, log_ok, log_skip,
+    logger, setup_logger,
+)
 
 
 # ─── 설정 ────────────────────────────────────────────────────────────────────
 
-JIRA_URL       = os.environ.get("JIRA_BASE_URL", "")
-EMAIL          = os.environ.get("JIRA_EMAIL", "")
-TOKEN          = os.environ.get("JIRA_API_TOKEN", "")
-
 TARGET_PROJECT = "SSCVE"
 
 SSCVE_TODO_STATUS_ID         = "10138"           # 할일
 SSCVE_IN_PROGRESS_STATUS_IDS = ("10109", "10148") # 진행중, 진행 중
 SSCVE_BRANCH_ISSUE_TYPE_IDS  = ("10124", "10004") # 작업, 버그
 
-REPO_PATH = r"C:\workspace\c-project"
-
-_DEFAULT_LOG_DIR = Path.home() / "Desktop" / "jira-sync-logs"
-LOG_DIR          = Path(os.environ.get("LOG_DIR", str(_DEFAULT_LOG_DIR)))
-
+# Phase 2 조회 조건 - assignee 만 실행 시 채움 (나머지는 모듈 로드 시 한 번만 구성)
+SSCVE_BRANCH_JQL = (
+    f"project={TARGET_PROJECT} "
+    "AND assignee={assignee} "
+    f"AND status IN ({', '.join((SSCVE_TODO_STATUS_ID, *SSCVE_IN_PROGRESS_STATUS_IDS))}) "
+    f"AND issuetype IN ({', '.join(SSCVE_BRANCH_ISSUE_TYPE_IDS)}) "
+    "ORDER BY updated DESC"
+)
+SSCVE_BRANCH_FIELDS = ("summary", "status")
 
-# ─── 로거 설정 ────────────────────────────────────────────────────────────────
-
-class _LevelFormatter(logging.Formatter):
-    """레벨명을 5자로 패딩: INFO -> INFO , ERROR -> ERROR"""
-    LEVEL_MAP = {
-        "INFO":     "INFO ",
-        "WARNING":  "WARN ",
-        "ERROR":    "ERROR",
-        "CRITICAL": "ERROR",
-        "OK":       "OK   ",
-        "SKIP":     "SKIP ",
-    }
-
-    def format(self, record: logging.LogRecord) -> str:
-        level = self.LEVEL_MAP.get(record.levelname, record.levelname[:5].ljust(5))
-        dt    = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-        return f"[{dt}] [{level}] {record.getMessage()}"
-
-
-OK_LEVEL   = 25
-SKIP_LEVEL = 26
-logging.addLevelName(OK_LEVEL,   "OK")
-logging.addLevelName(SKIP_LEVEL, "SKIP")
+REPO_PATH = r"C:\workspace\c-project"
 
+FEATURE_BASE_BRANCH = "develop"
 
-def _setup_logger() -> logging.Logger:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-    log_file = LOG_DIR / f"create_branches_{datetime.now().strftime('%Y%m%d')}.log"
+ACCOUNT_CACHE_FILE = Path.home() / ".jira_branch_creator" / "account.json"
 
-    formatter = _LevelFormatter()
+# 직전 실행에서 조회한 이슈 키 목록 - TTL 이내이고 모두 브랜치가 있으면 Jira 조회 생략
+PHASE2_CACHE_FILE = LOG_DIR / "phase2_cache.json"
+PHASE2_CACHE_TTL  = 300  # 초
 
-    file_handler = TimedRotatingFileHandler(
-        log_file, when="midnight", interval=1,
-        backupCount=0, encoding="utf-8"
-    )
-    file_handler.suffix = "%Y%m%d"
-    file_handler.setFormatter(formatter)
+# Windows 에서 git 실행 시 콘솔 창 생성 생략 (다른 OS 에서는 0)
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
 
-    logger = logging.getLogger("create_branches")
-    logger.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    return logger
+# ─── 유틸리티 ────────────────────────────────────────────────────────────────
 
+def resolve_account_id() -> str | None:
+    """현재 사용자 accountId 반환
 
-logger: logging.Logger = None  # main()에서 초기화
+    ACCOUNT_CACHE_FILE 에 같은 Jira URL/이메일로 저장된 값이 있으면 재사용하고,
+    없을 때만 /myself 를 호출해 저장한다. 조회 실패 시 None.
+    """
+    try:
+        cached = json.loads(ACCOUNT_CACHE_FILE.read_text(encoding="utf-8"))
+        if cached.get("jira_url") == JIRA_URL and cached.get("email") == EMAIL:
+            return cached["accountId"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    data = jira_get("/rest/api/3/myself")
+    if not data or "accountId" not in data:
+        return None
+    try:
+        ACCOUNT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        ACCOUNT_CACHE_FILE.write_text(
+            json.dumps({"jira_url": JIRA_URL, "email": EMAIL, "accountId": data["accountId"]}),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.warning(f"accountId 캐시 저장 실패: {e}")
+    return data["accountId"]
 
 
-def log_ok(msg: str)   -> None: logger.log(OK_LEVEL,   msg)
-def log_skip(msg: str) -> None: logger.log(SKIP_LEVEL, msg)
+# ─── Phase 2: SSCVE 할일/진행중 -> 브랜치 생성 ──────────────────────────────
 
+def fetch_sscve_issues_for_branch() -> tuple[list[dict], bool]:
+    """SSCVE 할일 + 진행중 이슈 중 이슈 유형이 '작업' 또는 '버그'인 것만 조회 -> (이슈 목록, 완료 여부)"""
+    account_id = resolve_account_id()
+    assignee   = f'"{account_id}"' if account_id else "currentUser()"
+    issues, complete = jira_search(SSCVE_BRANCH_JQL.format(assignee=assignee), SSCVE_BRANCH_FIELDS)
+    if not complete:
+        logger.warning(f"{TARGET_PROJECT} 이슈 조회 중 오류 - 받은 {len(issues)}건만 처리합니다.")
+    logger.info(f"{TARGET_PROJECT} '할일 + 진행중' 이슈: {len(issues)}건 조회됨")
+    return issues, complete
 
-# ─── 유틸리티 ────────────────────────────────────────────────────────────────
 
-def check_env() -> None:
-    missing = [v for v in ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN") if not os.environ.get(v)]
-    if missing:
-        logger.error(f"환경변수 누락: {', '.join(missing)}")
-        sys.exit(1)
+def load_phase2_cache() -> set[str] | None:
+    """PHASE2_CACHE_FILE 의 이슈 키 집합 반환 (없거나 손상됐거나 TTL 이 지났으면 None)"""
+    try:
+        cached = json.loads(PHASE2_CACHE_FILE.read_text(encoding="utf-8"))
+        if time.time() - cached["ts"] < PHASE2_CACHE_TTL:
+            return set(cached["keys"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
 
 
-def _auth_header() -> str:
-    return "Basic " + base64.b64encode(f"{EMAIL}:{TOKEN}".encode()).decode()
+def save_phase2_cache(keys: list[str]) -> None:
+    """PHASE2_CACHE_FILE 저장 (.tmp 에 쓴 뒤 교체)"""
+    tmp = PHASE2_CACHE_FILE.with_suffix(".tmp")
+    try:
+        PHASE2_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"ts": time.time(), "keys": keys}), encoding="utf-8")
+        os.replace(tmp, PHASE2_CACHE_FILE)
+    except OSError as e:
+        logger.warning(f"Phase 2 캐시 저장 실패: {e}")
 
 
-def jira_post(path: str, payload: dict) -> tuple[int, dict | None]:
-    body = json.dumps(payload).encode("utf-8")
-    req  = urllib.request.Request(
-        f"{JIRA_URL}{path}",
-        data=body,
-        headers={
-            "Authorization": _auth_header(),
-            "Accept":        "application/json",
-            "Content-Type":  "application/json",
-        },
-        method="POST",
+def _git(*args: str, stdin: bytes | None = None) -> subprocess.CompletedProcess:
+    """REPO_PATH 에서 git 실행. 출력은 bytes 로 받고 필요할 때만 _text()로 디코딩한다."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=REPO_PATH,
+        input=stdin,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=_NO_WINDOW,
     )
-    try:
-        with urllib.request.urlopen(req) as resp:
-            raw = resp.read()
-            return resp.status, json.loads(raw) if raw.strip() else None
-    except urllib.error.HTTPError as e:
-        logger.error(f"API {e.code} {e.reason}: {e.read().decode()[:300]}")
-        return e.code, None
-    except urllib.error.URLError as e:
-        logger.error(f"네트워크 오류: {e.reason}")
-        return 0, None
 
 
-# ─── Phase 2: SSCVE 할일/진행중 -> 브랜치 생성 ──────────────────────────────
-
-def fetch_sscve_issues_for_branch() -> list[dict]:
-    """SSCVE 할일 + 진행중 이슈 중 이슈 유형이 '작업' 또는 '버그'인 것만 조회"""
-    status_ids     = ", ".join([SSCVE_TODO_STATUS_ID] + list(SSCVE_IN_PROGRESS_STATUS_IDS))
-    issue_type_ids = ", ".join(SSCVE_BRANCH_ISSUE_TYPE_IDS)
-    _, data = jira_post("/rest/api/3/search/jql", {
-        "jql": (
-            f"project={TARGET_PROJECT} "
-            f"AND assignee=currentUser() "
-            f"AND status IN ({status_ids}) "
-            f"AND issuetype IN ({issue_type_ids}) "
-            f"ORDER BY updated DESC"
-        ),
-        "fields": ["summary", "issuetype", "status"],
-        "maxResults": 100,
-    })
-    if not data:
-        return []
-    issues = data.get("issues", [])
-    total  = data.get("total", len(issues))
-    logger.info(f"{TARGET_PROJECT} '할일 + 진행중' 이슈: {total}건 조회됨")
-    return issues
+def _text(raw: bytes) -> str:
+    """git 출력 디코딩 (로케일과 무관하게 UTF-8, 깨진 바이트는 치환)"""
+    return raw.decode("utf-8", errors="replace").strip()
 
 
 def get_local_branches() -> set[str]:
-    """로컬 브랜치 목록 반환"""
-    result = subprocess.run(
-        ["git", "branch", "--format=%(refname:short)"],
-        cwd=REPO_PATH,
-        capture_output=True,
-        text=True,
-    )
+    """로컬 feature/* 브랜치 목록 반환 (refs/heads/feature/ 아래만 조회)"""
+    result = _git("for-each-ref", "--format=%(refname:short)", "refs/heads/feature/")
     if result.returncode != 0:
-        logger.error(f"git branch 조회 실패: {result.stderr.strip()}")
+        logger.error(f"git for-each-ref 조회 실패: {_text(result.stderr)}")
         return set()
-    return {b.strip() for b in result.stdout.splitlines() if b.strip()}
+    return {b.strip() for b in _text(result.stdout).splitlines() if b.strip()}
 
 
 def pull_base_branches() -> None:
     """develop, release 브랜치 git pull (브랜치 생성 전 최신 상태 유지)"""
-    cur = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        cwd=REPO_PATH, capture_output=True, text=True,
-    )
-    current_branch = cur.stdout.strip() if cur.returncode == 0 else ""
+    cur = _git("rev-parse", "--abbrev-ref", "HEAD")
+    current_branch = _text(cur.stdout) if cur.returncode == 0 else ""
 
     for branch in ("develop", "release"):
         if current_branch == branch:
-            result = subprocess.run(
-                ["git", "pull"],
-                cwd=REPO_PATH, capture_output=True, text=True,
-            )
+            result = _git("pull")
         else:
-            result = subprocess.run(
-                ["git", "fetch", "origin", f"{branch}:{branch}"],
-                cwd=REPO_PATH, capture_output=True, text=True,
-            )
+            result = _git("fetch", "origin", f"{branch}:{branch}")
 
         if result.returncode == 0:
             log_ok(f"{branch} 브랜치 pull 완료")
         else:
-            stderr = result.stderr.strip()
+            stderr = _text(result.stderr)
             if any(msg in stderr for msg in ("couldn't find remote ref", "does not exist")):
                 logger.warning(f"{branch} 브랜치가 원격에 존재하지 않아 건너뜁니다.")
             else:
                 logger.warning(f"{branch} 브랜치 pull 실패: {stderr}")
 
 
-def create_flow_feature_branch(feature_name: str) -> bool:
-    """git flow feature start {feature_name} 실행"""
-    result = subprocess.run(
-        ["git", "flow", "feature", "start", feature_name],
-        cwd=REPO_PATH,
-        capture_output=True,
-        text=True,
-    )
+def create_feature_branches(feature_names: list[str]) -> list[str]:
+    """feature/{name} 브랜치들을 develop 기준으로 생성하고, 생성하지 못한 name 목록을 반환
+
+    develop SHA를 한 번만 조회한 뒤 git update-ref --stdin 단일 프로세스(단일 트랜잭션)로
+    모든 ref를 만든다. 체크아웃을 하지 않으므로 작업 트리는 건드리지 않는다.
+    트랜잭션은 ref 하나만 실패해도(조회 후 생긴 동명 브랜치, D/F 충돌 등) 전체가 취소되므로,
+    그때는 ref 마다 따로 만들어 실제로 실패한 브랜치만 골라낸다.
+
+    git flow 메타데이터(gitflow.branch.feature/{name}.base)는 기록하지 않는다.
+    git flow feature finish 는 값이 없으면 develop 으로 대체하므로
+    브랜치마다 git config 프로세스를 띄울 필요가 없다.
+    """
+    rev = _git("rev-parse", "--verify", f"{FEATURE_BASE_BRANCH}^{{commit}}")
+    if rev.returncode != 0:
+        logger.error(f"{FEATURE_BASE_BRANCH} 브랜치 조회 실패: {_text(rev.stderr)}")
+        return list(feature_names)
+    base_sha = _text(rev.stdout)
+
+    commands = "".join(f"create refs/heads/feature/{name} {base_sha}\n" for name in feature_names)
+    result   = _git("update-ref", "--stdin", stdin=commands.encode("utf-8"))
     if result.returncode == 0:
-        return True
-    logger.error(f"git flow feature start 실패: {result.stderr.strip()}")
-    return False
+        return []
+    logger.warning(f"git update-ref 일괄 생성 실패 - 브랜치별로 다시 시도합니다: {_text(result.stderr)}")
 
+    failed: list[str] = []
+    for name in feature_names:
+        # 이전 값을 빈 문자열로 주면 ref 가 없을 때만 생성 (create 와 같은 조건)
+        single = _git("update-ref", f"refs/heads/feature/{name}", base_sha, "")
+        if single.returncode != 0:
+            logger.error(f"[{name}] git update-ref 실패: {_text(single.stderr)}")
+            failed.append(name)
+    return failed
 
-def run_phase2(dry_run: bool) -> None:
-    """Phase 2: SSCVE 할일/진행중 이슈 -> git flow feature 브랜치 생성"""
+
+def run_phase2(dry_run: bool, use_cache: bool = True) -> None:
+    """Phase 2: SSCVE 할일/진행중 이슈 -> git flow feature 브랜치 생성
+
+    use_cache=False 면 PHASE2_CACHE_FILE 을 보지 않고 항상 Jira 를 조회한다
+    (직전 Phase 1 에서 새 SSCVE 이슈를 만든 경우 등).
+    """
     logger.info("=" * 50)
     logger.info(f"[Phase 2] {TARGET_PROJECT} '할일/진행중' -> git flow feature 브랜치 생성")
     if dry_run:
         logger.info("[DRY-RUN 모드: 실제 브랜치 생성 안 함]")
     logger.info("=" * 50)
     logger.info(f"저장소: {REPO_PATH}")
+    flush_console()
+
+    # pull 은 develop/release 만 갱신하므로 feature 브랜치 목록은 pull 전에 조회해도 같음
+    local_branches = get_local_branches()
+    cached_keys    = load_phase2_cache() if use_cache else None
+    # 빈 집합은 all() 이 항상 True 이므로 생략 근거가 될 수 없음 - 이슈가 있었던 캐시만 사용
+    if cached_keys and all(f"feature/{key}" in local_branches for key in cached_keys):
+        log_skip(f"최근 {PHASE2_CACHE_TTL}초 이내 조회한 이슈 {len(cached_keys)}건 모두 브랜치 존재 - Jira 조회 생략")
+        return
 
-    pull_base_branches()
+    # Jira 조회(네트워크)와 git pull(로컬 git)은 서로 독립적이므로 겹쳐서 실행
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        issues_future = executor.submit(fetch_sscve_issues_for_branch)
+        pull_base_branches()
+        issues, complete = issues_future.result()
 
-    issues = fetch_sscve_issues_for_branch()
     if not issues:
-        logger.info("'할일/진행중' 상태인 SSCVE 이슈가 없습니다.")
+        if complete:
+            logger.info("'할일/진행중' 상태인 SSCVE 이슈가 없습니다.")
         return
 
-    local_branches = get_local_branches()
-    logger.info(f"로컬 브랜치: {len(local_branches)}개")
+    logger.info(f"로컬 feature 브랜치: {len(local_branches)}개")
 
-    created, skipped, failed = 0, 0, 0
+    todo, skipped_keys = [], []
     for issue in issues:
+        if f"feature/{issue['key']}" in local_branches:
+            skipped_keys.append(issue["key"])
+        else:
+            todo.append(issue)
+    if skipped_keys:
+        log_skip(f"이미 존재하는 브랜치 {len(skipped_keys)}건: {', '.join(skipped_keys)}")
+
+    created, skipped, failed = 0, len(skipped_keys), 0
+    pending: list[str] = []
+    for issue in todo:
         key     = issue["key"]
         summary = issue["fields"]["summary"]
         status  = issue["fields"]["status"]["name"]
-        branch  = f"feature/{key}"
-
-        logger.info(f"[{key}] [{status}] 브랜치: {branch}")
-        logger.info(f"제목: {summary}")
 
-        if branch in local_branches:
-            log_skip(f"[{key}] 이미 존재하는 브랜치")
-            skipped += 1
-            continue
+        logger.info(f"[{key}] [{status}] 브랜치: feature/{key} | 제목: {summary}")
 
         if dry_run:
             logger.info(f"[{key}] [DRY-RUN] 생성 예정")
             created += 1
             continue
 
-        if create_flow_feature_branch(key):
+        pending.append(key)
+    flush_console()
+
+    if pending:
+        failed_keys = set(create_feature_branches(pending))
+        for key in pending:
+            if key in failed_keys:
+                logger.error(f"[{key}] 브랜치 생성 실패")
+                continue
             log_ok(f"[{key}] 브랜치 생성 완료")
-            local_branches.add(branch)
-            created += 1
-        else:
-            logger.error(f"[{key}] 브랜치 생성 실패")
-            failed += 1
+            local_branches.add(f"feature/{key}")
+        created += len(pending) - len(failed_keys)
+        failed  += len(failed_keys)
+
+    # 조회가 끝까지 성공했고 모든 이슈에 브랜치가 있을 때만 기록 - 다음 실행이 TTL 이내면 조회를 생략
+    if complete and not dry_run and not failed:
+        save_phase2_cache([issue["key"] for issue in issues])
 
     action = "생성 예정" if dry_run else "생성 완료"
     logger.info(f"Phase 2 완료: {action} {created}건 / 건너뜀 {skipped}건 / 실패 {failed}건")
@@ -290,8 +305,6 @@ def run_phase2(dry_run: bool) -> None:
 # ─── 메인 ────────────────────────────────────────────────────────────────────
 
 def main() -> None:
-    global logger
-
     parser = argparse.ArgumentParser(
         description="SSCVE 할일/진행중 이슈 -> git flow feature 브랜치 생성"
     )
@@ -302,7 +315,7 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    logger = _setup_logger()
+    setup_logger("create_branches")
     check_env()
 
     logger.info(f"SSCVE 이슈 -> git flow 브랜치 생성 시작")
@@ -9,7 +9,7 @@ INTQA -> SSCVE 이슈 동기화 스크립트
 
 로그:
   - 저장 위치: %USERPROFILE%\\Desktop\\jira-sync-logs\\
-  - 파일명: sync_intqa_YYYYMMDD.log (일별 자동 로테이션)
+  - 파일명: sync_intqa_YYYYMMDD.log (실행 일자별 파일, 같은 날은 이어쓰기)
   - 포맷: [YYYY-MM-DD HH:MM:SS] [LEVEL] MESSAGE
 
 Usage:
@@ -23,228 +23,168 @@ Usage:
     JIRA_EMAIL       - Jira 로그인 이메일 (필수)
     JIRA_API_TOKEN   - Jira API 토큰 (필수)
 
-Python 3.9+ 필요
+sync_and_create_branches.py 가 이 모듈의 run_phase1() 을 Phase 1 로 그대로 사용합니다.
+
+Python 3.10+ 필요
 """
 
 from __future__ import annotations
 
 import argparse
 import os
-import sys
 import json
-import base64
-import logging
-import urllib.request
-import urllib.error
-from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
-from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
 
-sys.stdout.reconfigure(encoding="utf-8")
+from _jira_client import (
+    LOG_DIR, check_env, flush_console, jira_get, jira_post, jira_search, log_ok, log_skip, logger,
+    setup_logger,
+)
 
 
 # ─── 설정 ────────────────────────────────────────────────────────────────────
 
-JIRA_URL             = os.environ.get("JIRA_BASE_URL", "")
-EMAIL                = os.environ.get("JIRA_EMAIL", "")
-TOKEN                = os.environ.get("JIRA_API_TOKEN", "")
-
 SOURCE_PROJECT       = "INTQA"
 TARGET_PROJECT       = "SSCVE"
 TARGET_ISSUE_TYPE_ID = "10004"   # 버그
 LINK_TYPE_ID         = "10000"   # 문의대응 (outward: 문의대응 처리 이슈)
 
+_TARGET_PREFIX = f"{TARGET_PROJECT}-"  # SSCVE 이슈 키 접두사
+
 # SSCVE 이슈 생성 옵션
 ASSIGNEE_ID  = "60fe2779e6e6f800718020a3"  # 하수임 (고정)
 PARENT_KEY   = "SSCVE-2561"               # 실행 시 인자로 변경 가능
 FIX_VERSION  = "2.0.32"                   # 실행 시 인자로 변경 가능
 
-_DEFAULT_LOG_DIR = Path.home() / "Desktop" / "jira-sync-logs"
-LOG_DIR          = Path(os.environ.get("LOG_DIR", str(_DEFAULT_LOG_DIR)))
-
-
-# ─── 로거 설정 ────────────────────────────────────────────────────────────────
-
-class _LevelFormatter(logging.Formatter):
-    """레벨명을 5자로 패딩: INFO -> INFO , ERROR -> ERROR"""
-    LEVEL_MAP = {
-        "INFO":     "INFO ",
-        "WARNING":  "WARN ",
-        "ERROR":    "ERROR",
-        "CRITICAL": "ERROR",
-        "OK":       "OK   ",
-        "SKIP":     "SKIP ",
-    }
+BULK_CREATE_SIZE = 50  # /issue/bulk 한 번에 생성 가능한 최대 이슈 수
+LINK_WORKERS     = 8   # 이슈 링크 생성 동시 요청 수 (링크는 bulk API 없음)
 
-    def format(self, record: logging.LogRecord) -> str:
-        level = self.LEVEL_MAP.get(record.levelname, record.levelname[:5].ljust(5))
-        dt    = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
-        return f"[{dt}] [{level}] {record.getMessage()}"
+# Phase 1 조회 조건 (실행 중 바뀌지 않으므로 모듈 로드 시 한 번만 구성)
+INTQA_IN_PROGRESS_JQL = (
+    f"project={SOURCE_PROJECT} "
+    "AND assignee=currentUser() "
+    "AND statusCategory=indeterminate "
+    "ORDER BY updated DESC"
+)
+INTQA_FIELDS = ("summary", "issuelinks")
 
+# SSCVE 버전명 -> 버전 ID (fetch_fix_version_id()가 첫 조회 시 전체 목록으로 채움)
+_version_ids: dict[str, str] | None = None
 
-OK_LEVEL   = 25
-SKIP_LEVEL = 26
-logging.addLevelName(OK_LEVEL,   "OK")
-logging.addLevelName(SKIP_LEVEL, "SKIP")
-
-
-def _setup_logger() -> logging.Logger:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-    log_file = LOG_DIR / f"sync_intqa_{datetime.now().strftime('%Y%m%d')}.log"
-
-    formatter = _LevelFormatter()
-
-    file_handler = TimedRotatingFileHandler(
-        log_file, when="midnight", interval=1,
-        backupCount=0, encoding="utf-8"
-    )
-    file_handler.suffix = "%Y%m%d"
-    file_handler.setFormatter(formatter)
-
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-
-    logger = logging.getLogger("sync_intqa")
-    logger.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    return logger
-
-
-logger: logging.Logger = None  # main()에서 초기화
-
-
-def log_ok(msg: str)   -> None: logger.log(OK_LEVEL,   msg)
-def log_skip(msg: str) -> None: logger.log(SKIP_LEVEL, msg)
+# INTQA 키 -> 생성한 SSCVE 키 기록 (링크 생성이 실패해도 다음 실행에서 중복 생성하지 않도록)
+SYNC_LEDGER_FILE = LOG_DIR / "sync_ledger.json"
 
 
 # ─── 유틸리티 ────────────────────────────────────────────────────────────────
 
-def check_env() -> None:
-    missing = [v for v in ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN") if not os.environ.get(v)]
-    if missing:
-        logger.error(f"환경변수 누락: {', '.join(missing)}")
-        sys.exit(1)
-
-
-def _auth_header() -> str:
-    return "Basic " + base64.b64encode(f"{EMAIL}:{TOKEN}".encode()).decode()
-
-
-_fix_version_id_cache: str | None = None
-
-
 def fetch_fix_version_id(version_name: str) -> str | None:
-    """버전명으로 SSCVE 프로젝트의 버전 ID 조회 (결과 캐싱)"""
-    global _fix_version_id_cache
-    if _fix_version_id_cache is not None:
-        return _fix_version_id_cache
-
-    data = jira_get(f"/rest/api/3/project/{TARGET_PROJECT}/versions")
-    if not data:
-        return None
-    for v in data:
-        if v.get("name") == version_name:
-            _fix_version_id_cache = v["id"]
-            return _fix_version_id_cache
-    logger.warning(f"버전 '{version_name}'을 찾을 수 없습니다.")
-    return None
+    """버전명으로 SSCVE 프로젝트의 버전 ID 조회
 
-
-def jira_get(path: str) -> dict | None:
-    req = urllib.request.Request(
-        f"{JIRA_URL}{path}",
-        headers={"Authorization": _auth_header(), "Accept": "application/json"},
-    )
-    try:
-        with urllib.request.urlopen(req) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        logger.error(f"API {e.code} {e.reason}: {e.read().decode()[:300]}")
-        return None
-    except urllib.error.URLError as e:
-        logger.error(f"네트워크 오류: {e.reason}")
-        return None
-
-
-def jira_post(path: str, payload: dict) -> tuple[int, dict | None]:
-    body = json.dumps(payload).encode("utf-8")
-    req  = urllib.request.Request(
-        f"{JIRA_URL}{path}",
-        data=body,
-        headers={
-            "Authorization": _auth_header(),
-            "Accept":        "application/json",
-            "Content-Type":  "application/json",
-        },
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req) as resp:
-            raw = resp.read()
-            return resp.status, json.loads(raw) if raw.strip() else None
-    except urllib.error.HTTPError as e:
-        logger.error(f"API {e.code} {e.reason}: {e.read().decode()[:300]}")
-        return e.code, None
-    except urllib.error.URLError as e:
-        logger.error(f"네트워크 오류: {e.reason}")
-        return 0, None
+    버전 목록 전체를 한 번 받아 _version_ids 에 보관하고, 목록에 없는 이름일 때만
+    다시 조회한다 (실행 중 새로 추가된 버전 대응).
+    """
+    global _version_ids
+    if _version_ids is None or version_name not in _version_ids:
+        data = jira_get(f"/rest/api/3/project/{TARGET_PROJECT}/versions")
+        if data is not None:
+            _version_ids = {v["name"]: v["id"] for v in data}
+    return (_version_ids or {}).get(version_name)
 
 
 # ─── Phase 1: INTQA -> SSCVE 동기화 ─────────────────────────────────────────
 
 def fetch_intqa_in_progress() -> list[dict]:
-    """INTQA 처리중 이슈 조회"""
-    _, data = jira_post("/rest/api/3/search/jql", {
-        "jql": (
-            f"project={SOURCE_PROJECT} "
-            "AND assignee=currentUser() "
-            "AND statusCategory=indeterminate "
-            "ORDER BY updated DESC"
-        ),
-        "fields": ["summary", "status"],
-        "maxResults": 100,
-    })
-    if not data:
-        return []
-    issues = data.get("issues", [])
+    """INTQA 처리중 이슈 조회 (중복 판단용 issuelinks 포함)"""
+    issues, complete = jira_search(INTQA_IN_PROGRESS_JQL, INTQA_FIELDS)
+    if not complete:
+        logger.warning(f"{SOURCE_PROJECT} 처리중 이슈 조회 중 오류 - 받은 {len(issues)}건만 처리합니다.")
     logger.info(f"{SOURCE_PROJECT} 처리중 이슈: {len(issues)}건 조회됨")
     return issues
 
 
-def fetch_linked_sscve_key(intqa_key: str) -> str | None:
-    """INTQA 이슈에 연결된 SSCVE 키 반환. 없으면 None."""
-    data = jira_get(f"/rest/api/3/issue/{intqa_key}?fields=issuelinks")
-    if not data:
+def _extract_linked_sscve(issue: dict) -> str | None:
+    """조회된 INTQA 이슈의 issuelinks 에서 연결된 SSCVE 키 반환. 없으면 None."""
+    links = issue["fields"].get("issuelinks")
+    if not links:
         return None
-    for link in data["fields"].get("issuelinks", []):
-        if link.get("type", {}).get("id") != LINK_TYPE_ID:
+    link_type_id, prefix = LINK_TYPE_ID, _TARGET_PREFIX
+    for link in links:
+        # .get(k, {}) 는 키가 있어도 빈 dict 를 매번 만들므로 'or {}' 로 없을 때만 생성
+        if (link.get("type") or {}).get("id") != link_type_id:
             continue
-        outward = link.get("outwardIssue", {})
-        if outward.get("key", "").startswith(f"{TARGET_PROJECT}-"):
-            return outward["key"]
+        key = (link.get("outwardIssue") or {}).get("key", "")
+        if key.startswith(prefix):
+            return key
     return None
 
 
-def create_sscve_issue(summary: str) -> str | None:
-    """SSCVE에 버그 이슈 생성 -> 새 이슈 키 반환. 실패 시 None."""
+def _sscve_issue_fields(summary: str, parent_key: str, fix_version_id: str | None) -> dict:
+    """SSCVE 버그 이슈 생성용 fields"""
     fields: dict = {
         "project":   {"key": TARGET_PROJECT},
         "summary":   summary,
         "issuetype": {"id": TARGET_ISSUE_TYPE_ID},
         "assignee":  {"accountId": ASSIGNEE_ID},
     }
-    if PARENT_KEY:
-        fields["parent"] = {"key": PARENT_KEY}
-    if FIX_VERSION:
-        version_id = fetch_fix_version_id(FIX_VERSION)
-        if version_id:
-            fields["fixVersions"] = [{"id": version_id}]
-
-    _, data = jira_post("/rest/api/3/issue", {"fields": fields})
-    if data and "key" in data:
-        return data["key"]
-    return None
+    if parent_key:
+        fields["parent"] = {"key": parent_key}
+    if fix_version_id:
+        fields["fixVersions"] = [{"id": fix_version_id}]
+    return fields
+
+
+def create_sscve_issues(
+    summaries: list[str],
+    parent_key: str,
+    fix_version_id: str | None,
+    on_chunk: Callable[[int, list[str | None]], None] | None = None,
+) -> list[str | None]:
+    """SSCVE에 버그 이슈 일괄 생성 (/issue/bulk, BULK_CREATE_SIZE 단위)
+
+    summaries 와 같은 순서로 새 이슈 키 목록 반환. 실패한 항목은 None.
+    on_chunk 가 있으면 묶음마다 (시작 인덱스, 그 묶음의 키 목록)으로 호출한다
+    - 다음 묶음 생성 요청 중에 앞 묶음의 후속 작업(링크)을 진행할 수 있도록.
+    """
+    keys: list[str | None] = []
+    for start in range(0, len(summaries), BULK_CREATE_SIZE):
+        chunk = summaries[start:start + BULK_CREATE_SIZE]
+        _, data = jira_post("/rest/api/3/issue/bulk", {
+            "issueUpdates": [{"fields": _sscve_issue_fields(summary, parent_key, fix_version_id)} for summary in chunk],
+        })
+        if not data:
+            keys.extend([None] * len(chunk))
+            continue
+
+        # issues 에는 성공한 항목만 요청 순서대로 담기고, 실패 항목은 errors[].failedElementNumber 로 표시됨
+        failed = {e.get("failedElementNumber") for e in data.get("errors", [])}
+        for e in data.get("errors", []):
+            logger.error(f"이슈 생성 오류 (#{e.get('failedElementNumber')}): {e.get('elementErrors')}")
+        created = iter(data.get("issues", []))
+        for i in range(len(chunk)):
+            issue = None if i in failed else next(created, None)
+            keys.append(issue["key"] if issue else None)
+        if on_chunk:
+            on_chunk(start, keys[start:])
+    return keys
+
+
+def load_sync_ledger() -> dict[str, str]:
+    """SYNC_LEDGER_FILE 읽기 (없거나 손상된 경우 빈 dict)"""
+    try:
+        return json.loads(SYNC_LEDGER_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_sync_ledger(ledger: dict[str, str]) -> None:
+    """SYNC_LEDGER_FILE 저장 (.tmp 에 쓴 뒤 교체)"""
+    tmp = SYNC_LEDGER_FILE.with_suffix(".tmp")
+    try:
+        SYNC_LEDGER_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(ledger, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, SYNC_LEDGER_FILE)
+    except OSError as e:
+        logger.warning(f"동기화 기록 저장 실패: {e}")
 
 
 def create_issue_link(intqa_key: str, sscve_key: str) -> bool:
@@ -257,49 +197,91 @@ def create_issue_link(intqa_key: str, sscve_key: str) -> bool:
     return status == 201
 
 
-def run_phase1() -> None:
-    """Phase 1: INTQA 처리중 이슈 -> SSCVE 이슈 생성"""
+def run_phase1(parent_key: str, fix_version: str) -> int:
+    """Phase 1: INTQA 처리중 이슈 -> SSCVE 이슈 생성. 새로 생성한 SSCVE 이슈 수를 반환.
+
+    parent_key 는 상위 항목(에픽) 키, fix_version 은 수정 버전명 (빈 문자열이면 지정 안 함).
+    버전 ID 는 생성할 이슈가 있을 때만 조회하고, 찾지 못하면 이번 실행의 이슈 생성을 건너뛴다.
+    """
     logger.info("=" * 50)
     logger.info(f"[Phase 1] {SOURCE_PROJECT} 처리중 -> {TARGET_PROJECT} 이슈 생성")
     logger.info("=" * 50)
+    flush_console()
 
     issues = fetch_intqa_in_progress()
     if not issues:
         logger.info("처리중인 INTQA 이슈가 없습니다.")
-        return
+        return 0
+
+    ledger      = load_sync_ledger()
+    ledger_size = len(ledger)
 
     created, skipped = 0, 0
+    to_create: list[tuple[str, str]] = []
     for issue in issues:
         key     = issue["key"]
         summary = issue["fields"]["summary"]
 
-        linked_key = fetch_linked_sscve_key(key)
+        linked_key = _extract_linked_sscve(issue)
         if linked_key:
+            ledger.setdefault(key, linked_key)
             log_skip(f"[{key}] 이미 연결된 SSCVE 이슈 존재: {linked_key}")
             logger.info(f"제목: {summary}")
             skipped += 1
             continue
-
-        new_key = create_sscve_issue(summary)
-        if not new_key:
-            logger.error(f"[{key}] SSCVE 이슈 생성 실패")
+        if key in ledger:
+            log_skip(f"[{key}] 이전 실행에서 생성된 SSCVE 이슈 존재 (링크 없음, 수동 연결 필요): {ledger[key]}")
             logger.info(f"제목: {summary}")
+            skipped += 1
             continue
+        to_create.append((key, summary))
+
+    fix_version_id = None
+    if to_create and fix_version:
+        fix_version_id = fetch_fix_version_id(fix_version)
+        if not fix_version_id:
+            logger.error(
+                f"수정 버전 '{fix_version}'을 찾을 수 없어 SSCVE 이슈 {len(to_create)}건 생성을 건너뜁니다."
+            )
+            to_create = []
+
+    if to_create:
+        flush_console()
+        # 묶음 생성이 끝나는 즉시 그 묶음의 링크를 제출 - 다음 묶음 생성과 링크 요청이 겹쳐서 진행됨
+        link_futures: dict[tuple[str, str], Future[bool]] = {}
+        with ThreadPoolExecutor(max_workers=LINK_WORKERS) as executor:
+            def submit_links(start: int, chunk_keys: list[str | None]) -> None:
+                for (key, _), new_key in zip(to_create[start:start + len(chunk_keys)], chunk_keys, strict=True):
+                    if new_key:
+                        link_futures[(key, new_key)] = executor.submit(create_issue_link, key, new_key)
+
+            new_keys = create_sscve_issues(
+                [summary for _, summary in to_create], parent_key, fix_version_id, on_chunk=submit_links,
+            )
+        linked = {pair: future.result() for pair, future in link_futures.items()}
+
+        for (key, summary), new_key in zip(to_create, new_keys, strict=True):
+            if not new_key:
+                logger.error(f"[{key}] SSCVE 이슈 생성 실패")
+                logger.info(f"제목: {summary}")
+                continue
+
+            ledger[key] = new_key
+            link_status = "링크 완료" if linked[(key, new_key)] else "링크 실패 (수동 연결 필요)"
+            log_ok(f"[{key}] -> [{new_key}] 생성 완료 / {link_status}")
+            logger.info(f"제목: {summary}")
+            created += 1
 
-        linked = create_issue_link(key, new_key)
-        link_status = "링크 완료" if linked else "링크 실패 (수동 연결 필요)"
-        log_ok(f"[{key}] -> [{new_key}] 생성 완료 / {link_status}")
-        logger.info(f"제목: {summary}")
-        created += 1
+    if len(ledger) != ledger_size:
+        save_sync_ledger(ledger)
 
     logger.info(f"Phase 1 완료: 생성 {created}건 / 건너뜀 {skipped}건")
+    return created
 
 
 # ─── 메인 ────────────────────────────────────────────────────────────────────
 
 def main() -> None:
-    global logger, PARENT_KEY, FIX_VERSION
-
     parser = argparse.ArgumentParser(
         description="INTQA 처리중 이슈 -> SSCVE 이슈 생성 + 링크 연결"
     )
@@ -317,16 +299,15 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    PARENT_KEY  = args.parent.upper()
-    FIX_VERSION = args.version
+    parent_key = args.parent.upper()
 
-    logger = _setup_logger()
+    setup_logger("sync_intqa")
     check_env()
 
     logger.info(f"INTQA -> SSCVE 이슈 동기화 시작")
-    logger.info(f"설정 - 상위 항목: {PARENT_KEY}, 수정 버전: {FIX_VERSION}")
+    logger.info(f"설정 - 상위 항목: {parent_key}, 수정 버전: {args.version}")
 
-    run_phase1()
+    run_phase1(parent_key, args.version)
 
     logger.info("완료")
 
@@ -17,6 +17,13 @@ SKILL_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PASS = 0
 FAIL = 0
 
+# 정규식은 모듈 로드 시 한 번만 컴파일 (re 모듈 내부 캐시에 의존하지 않음)
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+_NAME_FIELD_RE = re.compile(r"^name:\s*(.+)$", re.MULTILINE)
+_NAME_FORMAT_RE = re.compile(r"^[a-z][a-z0-9-]*[a-z0-9]$")
+_DESCRIPTION_FIELD_RE = re.compile(r"^description:\s*(.+?)(?=\n\w|\n---|\Z)", re.MULTILINE | re.DOTALL)
+
 
 def check_python_version() -> None:
     if sys.version_info < (3, 12):
@@ -53,7 +60,7 @@ def make_branch_name_test(issue_type: str, summary: str) -> str:
         case _:
             prefix = "feature"
 
-    slug = re.sub(r"[^a-z0-9]+", "-", summary.lower()).strip("-")[:50]
+    slug = _SLUG_RE.sub("-", summary.lower()).strip("-")[:50]
     key = "TEST-001"
     return f"{prefix}/{key}-{slug}" if slug else f"{prefix}/{key}"
 
@@ -93,18 +100,18 @@ def main() -> None:
     with open(skill_md, encoding="utf-8") as fh:
         content = fh.read()
 
-    fm_match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+    fm_match = _FRONTMATTER_RE.match(content)
     test("Frontmatter exists (--- delimiters)", fm_match is not None)
 
     if fm_match:
         fm = fm_match.group(1)
 
-        name_match = re.search(r"^name:\s*(.+)$", fm, re.MULTILINE)
+        name_match = _NAME_FIELD_RE.search(fm)
         test("'name' field exists", name_match is not None)
         if name_match:
             name = name_match.group(1).strip()
             test("name is lowercase with hyphens only",
-                 bool(re.match(r"^[a-z][a-z0-9-]*[a-z0-9]$", name)), f"got: '{name}'")
+                 bool(_NAME_FORMAT_RE.match(name)), f"got: '{name}'")
             test("name <= 64 chars", len(name) <= 64, f"got: {len(name)}")
             test("name has no consecutive hyphens", "--" not in name)
 
@@ -116,7 +123,7 @@ def main() -> None:
                      name == dir_name.replace("_", "-"),
                      f"name='{name}', dir='{dir_name}'")
 
-        desc_match = re.search(r"^description:\s*(.+?)(?=\n\w|\n---|\Z)", fm, re.MULTILINE | re.DOTALL)
+        desc_match = _DESCRIPTION_FIELD_RE.search(fm)
         test("'description' field exists", desc_match is not None)
         if desc_match:
             desc = desc_match.group(1).strip()
@@ -176,8 +183,8 @@ def main() -> None:
 
     # ─── 6. SKILL.md 크기 검증 ───────────────────────────────────────────
     print("📏 SKILL.md Size Check")
-    lines = content.split("\n")
-    test("SKILL.md under 500 lines (recommended)", len(lines) <= 500, f"got: {len(lines)} lines")
+    line_count = content.count("\n") + 1
+    test("SKILL.md under 500 lines (recommended)", line_count <= 500, f"got: {line_count} lines")
     test("SKILL.md under 5000 tokens (~20KB)", len(content) < 20000, f"got: {len(content)} chars")
     print()
 
@@ -2,12 +2,32 @@
 """
 Jira 이슈 자동 감시 → 브랜치 생성 스크립트
 
-새로 생성되는 Jira 이슈를 폴링하여 자동으로 Git 브랜치를 생성합니다.
+새로 생성되는 Jira 이슈를 폴링(또는 웹훅 수신)하여 자동으로 Git 브랜치를 생성합니다.
 
 Python 3.12+ 필요
 
 Usage:
-    python scripts/watch_jira.py
+    python scripts/watch_jira.py [--mode poll|webhook] [--port PORT]
+                                 [--interval SEC] [--poll-max-interval SEC]
+
+    --mode               poll     --interval 마다 최근 생성 이슈 조회 (기본값)
+                         webhook  Jira 웹훅(jira:issue_created)을 POST /webhooks/jira 로 받아 즉시 처리
+                                  (놓친 웹훅 대비로 폴링도 계속 수행)
+    --port               웹훅 수신 포트 (기본값: WEBHOOK_PORT 또는 8080)
+    --interval           폴링 간격 초 (기본값: POLL_INTERVAL 또는 30)
+    --poll-max-interval  새 이슈가 없을 때 늘어나는 폴링 간격 상한 초 (기본값: POLL_INTERVAL_MAX 또는 300)
+
+웹훅 등록 (Jira 설정 > 시스템 > 웹훅):
+    URL     : http://<이 PC 주소>:<port>/webhooks/jira
+    이벤트  : 이슈 - 생성됨 (jira:issue_created)
+    JQL     : project = SSCVE
+    비밀    : WEBHOOK_SECRET 과 같은 값 (선택, 설정 시 X-Hub-Signature 검증)
+
+    기본 수신 주소 WEBHOOK_HOST=127.0.0.1 은 이 PC 안에서만 접속할 수 있으므로
+    Jira Cloud 가 보내는 웹훅은 그대로는 도달하지 않는다. 역방향 프록시나 터널(ngrok,
+    cloudflared 등)로 공개 URL 을 이 주소로 연결하거나, WEBHOOK_HOST=0.0.0.0 으로 열고
+    방화벽/포트 포워딩을 설정한 뒤 그 공개 주소를 웹훅 URL 로 등록한다.
+    외부에 열 때는 WEBHOOK_SECRET 을 반드시 설정한다.
 
 환경변수:
     JIRA_BASE_URL    - Jira 인스턴스 URL (필수)
@@ -16,34 +36,74 @@ Usage:
     JIRA_PROJECT_KEY - 프로젝트 키 (선택, 없으면 입력 받음)
     REPO_PATH        - Git 레포지토리 경로 (선택, 기본: 현재 디렉토리)
     POLL_INTERVAL    - 폴링 간격 초 (선택, 기본: 30)
+    POLL_INTERVAL_MAX - 새 이슈가 없을 때 늘어나는 폴링 간격 상한 초 (선택, 기본: 300)
     BASE_BRANCH      - 기본 브랜치 (선택, 기본: develop)
+    WEBHOOK_HOST     - 웹훅 수신 주소 (선택, 기본: 127.0.0.1 - 로컬 전용, 위 웹훅 등록 참고)
+    WEBHOOK_PORT     - 웹훅 수신 포트 (선택, 기본: 8080)
+    WEBHOOK_SECRET   - 웹훅 비밀 값 (선택)
 """
 
 import os
 import sys
-import re
 import time
 import json
+import hmac
+import hashlib
+import argparse
+import functools
 import subprocess
-import urllib.request
+import http.client
+import queue
+import threading
 import urllib.parse
-import urllib.error
 import base64
-from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 # ─── 설정 ────────────────────────────────────────────────────────────────────
 
 JIRA_URL = os.environ.get("JIRA_BASE_URL", "")
 EMAIL = os.environ.get("JIRA_EMAIL", "")
 TOKEN = os.environ.get("JIRA_API_TOKEN", "")
+# 요청마다 base64 인코딩하지 않도록 한 번만 계산 (값이 비어 있으면 check_env()에서 종료됨)
+_AUTH_HEADER = "Basic " + base64.b64encode(f"{EMAIL}:{TOKEN}".encode()).decode()
 PROJECT = os.environ.get("JIRA_PROJECT_KEY", "")
 REPO_PATH = os.environ.get("REPO_PATH", os.getcwd())
 POLL_INTERVAL = int(os.environ.get("POLL_INTERVAL", "30"))
+POLL_INTERVAL_MAX = max(POLL_INTERVAL, int(os.environ.get("POLL_INTERVAL_MAX", "300")))
 BASE_BRANCH = os.environ.get("BASE_BRANCH", "develop")
+WEBHOOK_HOST = os.environ.get("WEBHOOK_HOST", "127.0.0.1")
+WEBHOOK_PORT = int(os.environ.get("WEBHOOK_PORT", "8080"))
+WEBHOOK_SECRET = os.environ.get("WEBHOOK_SECRET", "")
+WEBHOOK_PATH = "/webhooks/jira"
+WEBHOOK_MAX_BODY = 1024 * 1024  # 웹훅 본문 상한 (바이트) - 이슈 생성 이벤트는 수십 KB 수준
+
+SEARCH_PAGE_SIZE = 100   # /search/jql 페이지당 이슈 수
+SEARCH_MAX_ISSUES = 1000  # 한 번 조회에서 받을 최대 이슈 수 (안전 상한)
+RETRY_AFTER_DEFAULT = 5   # 429 응답에 Retry-After 가 없거나 해석 불가할 때 대기 초
 
 ALLOWED_PROJECT = "SSCVE"
 
 
+# bytes.translate 용 고정 테이블 (256 바이트): [a-z0-9]는 그대로, 그 외 바이트는 모두 '-'
+_SLUG_KEEP = b"abcdefghijklmnopqrstuvwxyz0123456789"
+_SLUG_TABLE = bytes(b if b in _SLUG_KEEP else ord("-") for b in range(256))
+
+# JSON 직렬화/파싱 - orjson 이 설치돼 있으면 사용 (bytes 를 그대로 파싱/반환), 없으면 표준 json
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
+# 폴링마다 TCP/TLS 핸드셰이크를 새로 하지 않도록 keep-alive 연결 1개를 재사용 (단일 스레드)
+_conn: http.client.HTTPConnection | None = None
+
+
 # ─── 유틸리티 ────────────────────────────────────────────────────────────────
 
 def check_python_version() -> None:
@@ -55,9 +115,10 @@ def check_python_version() -> None:
 
 def check_env() -> None:
     """필수 환경변수 확인"""
+    # import 시 읽어 둔 값으로 검사 (os.environ 재조회 없음)
     missing = [
-        var for var in ("JIRA_BASE_URL", "JIRA_EMAIL", "JIRA_API_TOKEN")
-        if not os.environ.get(var)
+        var for var, value in (("JIRA_BASE_URL", JIRA_URL), ("JIRA_EMAIL", EMAIL), ("JIRA_API_TOKEN", TOKEN))
+        if not value
     ]
     if missing:
         print(f"❌ Missing environment variables: {', '.join(missing)}")
@@ -69,74 +130,142 @@ def check_env() -> None:
         sys.exit(1)
 
 
-def jira_request(path: str) -> dict | None:
-    """Jira REST API 요청"""
-    url = f"{JIRA_URL}{path}"
-    creds = base64.b64encode(f"{EMAIL}:{TOKEN}".encode()).decode()
-    req = urllib.request.Request(url, headers={
-        "Authorization": f"Basic {creds}",
+def _jira_connection() -> http.client.HTTPConnection:
+    """Jira keep-alive 연결 반환 (최초 호출 시 생성)"""
+    global _conn
+    if _conn is None:
+        url = urllib.parse.urlsplit(JIRA_URL)
+        conn_cls = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        _conn = conn_cls(url.netloc, timeout=30)
+    return _conn
+
+
+def _reset_connection() -> None:
+    """끊긴 연결을 닫고 다음 요청에서 새로 연결하도록 초기화"""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def _send(
+    method: str, url_path: str, body: bytes | None, headers: dict[str, str]
+) -> tuple[http.client.HTTPResponse, bytes] | None:
+    """keep-alive 연결로 요청 1회 전송 (서버가 닫은 연결은 1회 재연결). 네트워크 오류 시 None"""
+    for attempt in range(2):
+        try:
+            conn = _jira_connection()
+            conn.request(method, url_path, body=body, headers=headers)
+            resp = conn.getresponse()
+            return resp, resp.read()
+        except (ConnectionError, http.client.HTTPException) as e:
+            _reset_connection()
+            if attempt:
+                print(f"❌ Network error: {e}")
+        except OSError as e:
+            _reset_connection()
+            print(f"❌ Network error: {e}")
+            break
+    return None
+
+
+def jira_request(path: str, payload: dict | None = None) -> dict | None:
+    """Jira REST API 요청 - payload 가 있으면 JSON POST, 없으면 GET
+
+    429 응답은 Retry-After 만큼 기다린 뒤 1회 재시도한다.
+    """
+    url_path = urllib.parse.urlsplit(JIRA_URL).path.rstrip("/") + path
+    headers = {
+        "Authorization": _AUTH_HEADER,
         "Accept": "application/json",
-    })
-    try:
-        with urllib.request.urlopen(req) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        print(f"❌ Jira API error: {e.code} {e.reason}")
+    }
+    method, body = "GET", None
+    if payload is not None:
+        method, body = "POST", _dumps(payload)
+        headers["Content-Type"] = "application/json"
+
+    sent = _send(method, url_path, body, headers)
+    if sent and sent[0].status == 429:
+        try:
+            delay = float(sent[0].getheader("Retry-After"))
+        except (TypeError, ValueError):
+            delay = RETRY_AFTER_DEFAULT
+        print(f"⏳ Jira rate limit (429) - retrying in {delay:.0f}s")
+        time.sleep(delay)
+        sent = _send(method, url_path, body, headers)
+    if sent is None:
         return None
-    except urllib.error.URLError as e:
-        print(f"❌ Network error: {e.reason}")
+    resp, raw = sent
+
+    if resp.status >= 400:
+        print(f"❌ Jira API error: {resp.status} {resp.reason}")
         return None
+    return _loads(raw)
 
 
-def get_recent_issues(project_key: str, since_minutes: int = 2) -> list[dict]:
-    """최근 N분 이내 생성된 이슈 조회"""
+def get_recent_issues(project_key: str, since_minutes: int = 2) -> list[dict] | None:
+    """최근 N분 이내 생성된 이슈 조회 (조회 실패 시 None)"""
     jql = (
         f"project={project_key} "
         f"AND created >= -{since_minutes}m "
         f"ORDER BY created DESC"
     )
-    encoded_jql = urllib.parse.quote(jql)
-    path = f"/rest/api/3/search?jql={encoded_jql}&maxResults=10&fields=summary,issuetype"
-    data = jira_request(path)
-    return data.get("issues", []) if data else []
-
+    payload: dict = {
+        "jql": jql,
+        "fields": ["summary", "issuetype"],
+        "maxResults": SEARCH_PAGE_SIZE,
+    }
+    # nextPageToken 으로 끝까지 페이징 (SEARCH_MAX_ISSUES 에서 중단)
+    issues: list[dict] = []
+    while len(issues) < SEARCH_MAX_ISSUES:
+        data = jira_request("/rest/api/3/search/jql", payload)
+        if data is None:
+            return None
+        issues.extend(data.get("issues", []))
+        token = data.get("nextPageToken")
+        if data.get("isLast") or not token:
+            break
+        payload["nextPageToken"] = token
+    return issues[:SEARCH_MAX_ISSUES]
 
-def make_branch_name(issue: dict) -> str:
-    """이슈 정보로부터 브랜치명 생성 (match-case 사용)"""
-    key = issue["key"]
-    itype = issue["fields"]["issuetype"]["name"].lower()
-    summary = issue["fields"]["summary"]
 
+@functools.lru_cache(maxsize=32)
+def _branch_prefix(issue_type: str) -> str:
+    """이슈 타입명 -> 브랜치 prefix (match-case 사용, 타입명별로 lower() 는 한 번만 수행)"""
     # Python 3.10+ match-case
-    match itype:
+    match issue_type.lower():
         case "bug":
-            prefix = "bugfix"
+            return "bugfix"
         case "story":
-            prefix = "feature"
+            return "feature"
         case "task":
-            prefix = "task"
+            return "task"
         case "epic":
-            prefix = "epic"
+            return "epic"
         case "subtask" | "sub-task":
-            prefix = "feature"
+            return "feature"
         case _:
-            prefix = "feature"
+            return "feature"
 
-    slug = re.sub(r"[^a-z0-9]+", "-", summary.lower()).strip("-")[:50]
+
+def make_branch_name(issue: dict) -> str:
+    """이슈 정보로부터 브랜치명 생성"""
+    key = issue["key"]
+    prefix = _branch_prefix(issue["fields"]["issuetype"]["name"])
+    summary = issue["fields"]["summary"]
+
+    # 비 ASCII 문자는 '?' 한 바이트로 바꾼 뒤 테이블에서 '-'가 됨. 한 번의 translate 후
+    # split/join 으로 연속된 '-' 병합 + 양끝 '-' 제거 (정규식 미사용)
+    raw = summary.lower().encode("ascii", "replace").translate(_SLUG_TABLE)
+    slug = "-".join(filter(None, raw.decode("ascii").split("-")))[:50]
     return f"{prefix}/{key}-{slug}" if slug else f"{prefix}/{key}"
 
 
-def create_branch(branch_name: str) -> bool:
-    """Git 브랜치 생성 (Windows/Linux/Mac 호환)"""
-    cmds = [
-        ["git", "fetch", "origin"],
-        ["git", "checkout", BASE_BRANCH],
-        ["git", "pull", "origin", BASE_BRANCH],
-        ["git", "checkout", "-b", branch_name],
-    ]
+def _run_git(*cmds: list[str]) -> bool:
+    """git 명령을 순서대로 실행 (Windows/Linux/Mac 호환). 실패 시 오류 출력 후 False"""
     try:
         for cmd in cmds:
-            subprocess.run(cmd, cwd=REPO_PATH, check=True, capture_output=True, text=True)
+            subprocess.run(["git", *cmd], cwd=REPO_PATH, check=True, capture_output=True, text=True)
         return True
     except subprocess.CalledProcessError as e:
         print(f"    ❌ Git error: {e.stderr.strip()}")
@@ -146,9 +275,244 @@ def create_branch(branch_name: str) -> bool:
         return False
 
 
+def update_base_branch() -> bool:
+    """기본 브랜치를 원격 최신으로 갱신 (폴링 1회당 한 번만 실행)
+
+    pull 이 기본 브랜치를 직접 fetch 하므로 별도의 'git fetch origin' 은 실행하지 않는다.
+    """
+    return _run_git(
+        ["checkout", BASE_BRANCH],
+        ["pull", "origin", BASE_BRANCH],
+    )
+
+
+def create_branch(branch_name: str) -> bool:
+    """기본 브랜치에서 Git 브랜치 생성 (시작점을 명시하므로 같은 폴링의 다음 브랜치도 기본 브랜치 기준)"""
+    return _run_git(["checkout", "-b", branch_name, BASE_BRANCH])
+
+
+# ─── 브랜치 생성 ─────────────────────────────────────────────────────────────
+
+def handle_new_issues(issues: list[dict], seen: set[str]) -> int:
+    """seen 에 없는 이슈마다 브랜치 생성 (폴링/웹훅 공용). 새 이슈 수 반환"""
+    new_issues = [issue for issue in issues if issue["key"] not in seen]
+    seen.update(issue["key"] for issue in new_issues)
+
+    # fetch/checkout/pull 은 새 이슈가 몇 건이든 한 번만 (첫 새 이슈에서 실행)
+    base_ready: bool | None = None
+    for issue in new_issues:
+        branch = make_branch_name(issue)
+        ts = time.strftime("%Y-%m-%d %H:%M:%S")  # datetime 객체 생성 없이 현재 시각 포맷
+        summary = issue["fields"]["summary"]
+        itype = issue["fields"]["issuetype"]["name"]
+
+        print(f"[{ts}] 🆕 New issue detected!")
+        print(f"    Key     : {issue['key']}")
+        print(f"    Type    : {itype}")
+        print(f"    Summary : {summary}")
+        print(f"    Branch  : {branch}")
+
+        if base_ready is None:
+            base_ready = update_base_branch()
+        if base_ready and create_branch(branch):
+            print("    ✅ Branch created successfully!")
+        print()
+    return len(new_issues)
+
+
+def _wait_for_webhooks(seconds: float, inbox: queue.SimpleQueue | None, seen: set[str]) -> None:
+    """seconds 동안 대기. inbox 가 있으면 웹훅으로 들어온 이슈를 도착 즉시 처리
+
+    Windows 에서도 Ctrl+C 가 먹히도록 큐 대기는 1초 단위로 끊는다.
+    """
+    if inbox is None:
+        time.sleep(seconds)
+        return
+    deadline = time.monotonic() + seconds
+    while (remaining := deadline - time.monotonic()) > 0:
+        try:
+            pushed = [inbox.get(timeout=min(remaining, 1.0))]
+        except queue.Empty:
+            continue
+        while True:
+            try:
+                pushed.append(inbox.get_nowait())
+            except queue.Empty:
+                break
+        handle_new_issues(pushed, seen)
+
+
+def run_poll(
+    project: str,
+    seen: set[str],
+    base_interval: int,
+    max_interval: int,
+    inbox: queue.SimpleQueue | None = None,
+) -> None:
+    """최근 생성 이슈 주기적 조회 (inbox 가 있으면 대기 중 웹훅 이슈를 바로 처리)
+
+    조회 범위는 마지막으로 성공한 조회 시각부터 (분 단위 올림 + 1분 여유, 최소 2분) 이므로
+    git 작업이 오래 걸리거나 조회가 실패해도 그 사이 생성된 이슈를 놓치지 않는다.
+    새 이슈가 없으면 간격을 두 배씩 늘리고(최대 max_interval),
+    새 이슈가 나오면 base_interval 로 되돌린다.
+    """
+    print("🔄 Watching for new issues... (Ctrl+C to stop)\n")
+    interval = base_interval
+    last_poll = time.monotonic()
+    while True:
+        poll_started = time.monotonic()
+        since_minutes = max(2, -(-int(poll_started - last_poll) // 60) + 1)
+        issues = get_recent_issues(project, since_minutes=since_minutes)
+        if issues is not None:
+            last_poll = poll_started
+        found = handle_new_issues(issues or [], seen)
+
+        next_interval = base_interval if found else min(interval * 2, max_interval)
+        if next_interval != interval:
+            print(f"⏱️  Poll interval: {next_interval}s")
+            interval = next_interval
+        _wait_for_webhooks(interval, inbox, seen)
+
+
+def _valid_signature(body: bytes, signature: str | None) -> bool:
+    """WEBHOOK_SECRET 이 설정된 경우 X-Hub-Signature(sha256=<hex>) 검증"""
+    if not WEBHOOK_SECRET:
+        return True
+    expected = "sha256=" + hmac.new(WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    return signature is not None and hmac.compare_digest(signature, expected)
+
+
+def _valid_webhook_issue(issue: object, project: str) -> bool:
+    """웹훅 issue 가 브랜치 생성에 필요한 형태인지 확인
+
+    키는 '{project}-<숫자>' 형식이어야 하고 (git 브랜치명/명령 인자로 그대로 쓰이므로),
+    fields.project.key / fields.summary / fields.issuetype.name 이 모두 있어야 한다.
+    """
+    if not isinstance(issue, dict):
+        return False
+    key = issue.get("key")
+    fields = issue.get("fields")
+    if not (isinstance(key, str) and isinstance(fields, dict)):
+        return False
+    number = key.removeprefix(f"{project}-")
+    if number == key or not (number.isascii() and number.isdigit()):
+        return False
+    project_info = fields.get("project")
+    issuetype = fields.get("issuetype")
+    return (
+        isinstance(project_info, dict)
+        and project_info.get("key") == project
+        and isinstance(fields.get("summary"), str)
+        and isinstance(issuetype, dict)
+        and isinstance(issuetype.get("name"), str)
+    )
+
+
+def run_webhook(project: str, seen: set[str], port: int, base_interval: int, max_interval: int) -> None:
+    """Jira 웹훅 수신 + 폴링 병행
+
+    수신 스레드는 이슈를 큐에 넣기만 하고, 브랜치 생성(git)은 폴링 루프가 있는 메인 스레드에서만
+    수행하므로 git 작업이 겹치지 않는다. 폴링은 놓친 웹훅을 보완한다.
+    """
+    inbox: queue.SimpleQueue = queue.SimpleQueue()
+
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: object) -> None:
+            pass  # 요청마다 찍히는 접근 로그 생략
+
+        def do_POST(self) -> None:
+            if self.path.split("?", 1)[0] != WEBHOOK_PATH:
+                self.send_response(404)
+                self.end_headers()
+                return
+            # 본문을 읽기 전에 길이를 검사 - 잘못된 헤더는 400, 상한 초과는 413
+            length = self.headers.get("Content-Length", "")
+            if not (length.isascii() and length.isdigit()):
+                self.send_response(400)
+                self.end_headers()
+                return
+            if int(length) > WEBHOOK_MAX_BODY:
+                print(f"⚠️  Webhook body too large ({length} bytes) - rejected")
+                self.send_response(413)
+                self.end_headers()
+                return
+            body = self.rfile.read(int(length))
+            if not _valid_signature(body, self.headers.get("X-Hub-Signature")):
+                print("❌ Webhook signature mismatch - ignored")
+                self.send_response(401)
+                self.end_headers()
+                return
+            try:
+                payload = _loads(body)
+            except ValueError:
+                payload = None
+            if not isinstance(payload, dict):
+                self.send_response(400)
+                self.end_headers()
+                return
+
+            if payload.get("webhookEvent") != "jira:issue_created":
+                self.send_response(204)
+                self.end_headers()
+                return
+
+            issue = payload.get("issue")
+            if not _valid_webhook_issue(issue, project):
+                print("⚠️  Webhook issue payload rejected (unexpected key/fields)")
+                self.send_response(400)
+                self.end_headers()
+                return
+
+            self.send_response(204)
+            self.end_headers()
+            inbox.put(issue)
+
+    if not WEBHOOK_SECRET:
+        print("⚠️  WEBHOOK_SECRET is not set - webhook requests are not authenticated.")
+        print("   Any process that can reach this port can trigger branch creation.")
+    server = HTTPServer((WEBHOOK_HOST, port), WebhookHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"📡 Listening for Jira webhooks on http://{WEBHOOK_HOST}:{port}{WEBHOOK_PATH}")
+    try:
+        run_poll(project, seen, base_interval, max_interval, inbox)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 # ─── 메인 ────────────────────────────────────────────────────────────────────
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Jira 이슈 자동 감시 → 브랜치 생성")
+    parser.add_argument(
+        "--mode",
+        choices=("poll", "webhook"),
+        default="poll",
+        help="poll: 주기적 조회 (기본값), webhook: Jira 웹훅 수신 + 주기적 조회",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=WEBHOOK_PORT,
+        help=f"웹훅 수신 포트 (기본값: {WEBHOOK_PORT})",
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=POLL_INTERVAL,
+        help=f"폴링 간격 초 (기본값: {POLL_INTERVAL})",
+    )
+    parser.add_argument(
+        "--poll-max-interval",
+        type=int,
+        default=POLL_INTERVAL_MAX,
+        help=f"새 이슈가 없을 때 늘어나는 폴링 간격 상한 초 (기본값: {POLL_INTERVAL_MAX})",
+    )
+    args = parser.parse_args()
+    if args.interval < 1:
+        parser.error("--interval 은 1 이상이어야 합니다.")
+    max_interval = max(args.interval, args.poll_max_interval)
+
     check_python_version()
     check_env()
 
@@ -174,42 +538,24 @@ def main() -> None:
     print(f"  Python        : {sys.version.split()[0]}")
     print(f"  Repo path     : {REPO_PATH}")
     print(f"  Base branch   : {BASE_BRANCH}")
-    print(f"  Poll interval : {POLL_INTERVAL}s")
+    if args.mode == "webhook":
+        print(f"  Mode          : webhook (port {args.port}) + poll")
+    print(f"  Poll interval : {args.interval}s (max {max_interval}s)")
     print("========================================\n")
     print("👀 Scanning existing issues...")
 
     # 첫 실행: 기존 이슈를 seen에 등록 (브랜치 생성 안 함)
-    existing = get_recent_issues(project, since_minutes=60)
+    existing = get_recent_issues(project, since_minutes=60) or []
     seen.update(issue["key"] for issue in existing)
     print(f"   Skipped {len(seen)} existing issue(s).\n")
-    print("🔄 Watching for new issues... (Ctrl+C to stop)\n")
 
-    while True:
-        try:
-            issues = get_recent_issues(project, since_minutes=2)
-            for issue in issues:
-                if issue["key"] not in seen:
-                    seen.add(issue["key"])
-                    branch = make_branch_name(issue)
-                    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    summary = issue["fields"]["summary"]
-                    itype = issue["fields"]["issuetype"]["name"]
-
-                    print(f"[{ts}] 🆕 New issue detected!")
-                    print(f"    Key     : {issue['key']}")
-                    print(f"    Type    : {itype}")
-                    print(f"    Summary : {summary}")
-                    print(f"    Branch  : {branch}")
-
-                    if create_branch(branch):
-                        print("    ✅ Branch created successfully!")
-                    print()
-
-            time.sleep(POLL_INTERVAL)
-
-        except KeyboardInterrupt:
-            print("\n👋 Stopped watching. Goodbye!")
-            break
+    try:
+        if args.mode == "webhook":
+            run_webhook(project, seen, args.port, args.interval, max_interval)
+        else:
+            run_poll(project, seen, args.interval, max_interval)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching. Goodbye!")
 
 
 if __name__ == "__main__":
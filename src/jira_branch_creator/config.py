@@ -5,13 +5,16 @@
 
 from __future__ import annotations
 
+import functools
 import os
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from jira_branch_creator.exceptions import ConfigError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraConfig:
     """Jira 연결 설정."""
 
@@ -19,9 +22,11 @@ class JiraConfig:
     email: str
     api_token: str
     project_key: str = "SSCVE"
+    pool_size: int = 32
+    transitions_cache_ttl: float = 30.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GitLabConfig:
     """GitLab 연결 설정."""
 
@@ -29,30 +34,43 @@ class GitLabConfig:
     token: str
     project_id: str
     default_branch: str = "develop"
+    pool_size: int = 32
+    branch_cache_ttl: float = 30.0
 
 
-@dataclass(frozen=True)
+# 이슈 타입별 기본 브랜치 prefix. 읽기 전용으로 모든 BranchNamingConfig 가 공유합니다.
+DEFAULT_PREFIXES: Mapping[str, str] = MappingProxyType({
+    "bug": "bugfix",
+    "story": "feature",
+    "task": "task",
+    "epic": "epic",
+    "subtask": "feature",
+})
+
+
+@dataclass(frozen=True, slots=True)
 class BranchNamingConfig:
-    """브랜치 네이밍 설정."""
+    """브랜치 네이밍 설정.
+
+    generate_branch_name 의 캐시 키로 쓰이므로 생성 후에는 바뀌지 않아야 합니다.
+    prefix_map 은 생성 시 복사해 읽기 전용 매핑으로 고정하므로, 넘긴 dict 를
+    나중에 수정해도 설정(과 캐시된 브랜치명)에는 영향이 없습니다.
+    prefix_map 은 해시에서만 제외되고 동등 비교에는 포함됩니다.
+    """
 
     max_slug_length: int = 50
-    prefix_map: dict[str, str] | None = None
+    prefix_map: Mapping[str, str] | None = field(default=None, hash=False)
+
+    def __post_init__(self) -> None:
+        if self.prefix_map is not None:
+            object.__setattr__(self, "prefix_map", MappingProxyType(dict(self.prefix_map)))
 
     @property
-    def prefixes(self) -> dict[str, str]:
-        if self.prefix_map:
-            return self.prefix_map
-        return {
-            "bug": "bugfix",
-            "story": "feature",
-            "task": "task",
-            "epic": "epic",
-            "subtask": "feature",
-            "sub-task": "feature",
-        }
-
-
-@dataclass(frozen=True)
+    def prefixes(self) -> Mapping[str, str]:
+        return self.prefix_map or DEFAULT_PREFIXES
+
+
+@dataclass(frozen=True, slots=True)
 class TrayConfig:
     """시스템 트레이 설정."""
 
@@ -62,7 +80,7 @@ class TrayConfig:
     notify_on_create: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """애플리케이션 전체 설정."""
 
@@ -70,6 +88,7 @@ class AppConfig:
     gitlab: GitLabConfig
     branch_naming: BranchNamingConfig
     tray: TrayConfig = TrayConfig()
+    max_workers: int = 8
 
 
 def _require_env(name: str) -> str:
@@ -83,26 +102,37 @@ def _require_env(name: str) -> str:
     return value
 
 
+@functools.cache
 def load_config() -> AppConfig:
     """환경변수에서 설정을 로드합니다.
 
+    결과는 프로세스당 한 번만 만들어 재사용합니다. 환경변수 변경을 다시 반영하려면
+    ``load_config.cache_clear()`` 를 호출하세요. 누락 시 발생한 ConfigError 는 캐시되지 않습니다.
+
     필수 환경변수:
         JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN
         GITLAB_URL, GITLAB_TOKEN, GITLAB_PROJECT_ID
 
     선택 환경변수:
         JIRA_PROJECT_KEY (기본: SSCVE)
+        JIRA_POOL_SIZE (기본: 32)
+        JIRA_TRANSITIONS_CACHE_TTL (기본: 30초, 0이면 캐시 안 함)
         GITLAB_DEFAULT_BRANCH (기본: develop)
+        GITLAB_POOL_SIZE (기본: 32)
+        GITLAB_BRANCH_CACHE_TTL (기본: 30초, 0이면 캐시 안 함)
         BRANCH_MAX_SLUG_LENGTH (기본: 50)
         TRAY_POLL_INTERVAL (기본: 30)
         TRAY_AUTOSTART (기본: false)
         TRAY_NOTIFY (기본: true)
+        WORKFLOW_MAX_WORKERS (기본: 8)
     """
     jira = JiraConfig(
         base_url=_require_env("JIRA_BASE_URL").rstrip("/"),
         email=_require_env("JIRA_EMAIL"),
         api_token=_require_env("JIRA_API_TOKEN"),
         project_key=os.environ.get("JIRA_PROJECT_KEY", "SSCVE").strip(),
+        pool_size=int(os.environ.get("JIRA_POOL_SIZE", "32")),
+        transitions_cache_ttl=float(os.environ.get("JIRA_TRANSITIONS_CACHE_TTL", "30")),
     )
 
     gitlab = GitLabConfig(
@@ -110,6 +140,8 @@ def load_config() -> AppConfig:
         token=_require_env("GITLAB_TOKEN"),
         project_id=_require_env("GITLAB_PROJECT_ID"),
         default_branch=os.environ.get("GITLAB_DEFAULT_BRANCH", "develop").strip(),
+        pool_size=int(os.environ.get("GITLAB_POOL_SIZE", "32")),
+        branch_cache_ttl=float(os.environ.get("GITLAB_BRANCH_CACHE_TTL", "30")),
     )
 
     branch_naming = BranchNamingConfig(
@@ -122,4 +154,10 @@ def load_config() -> AppConfig:
         notify_on_create=os.environ.get("TRAY_NOTIFY", "true").lower() in ("1", "true", "yes"),
     )
 
-    return AppConfig(jira=jira, gitlab=gitlab, branch_naming=branch_naming, tray=tray)
+    return AppConfig(
+        jira=jira,
+        gitlab=gitlab,
+        branch_naming=branch_naming,
+        tray=tray,
+        max_workers=int(os.environ.get("WORKFLOW_MAX_WORKERS", "8")),
+    )
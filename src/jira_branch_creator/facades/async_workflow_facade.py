@@ -0,0 +1,95 @@
+"""비동기 워크플로우 Facade.
+
+asyncio 기반 호출자(봇, 배치 오케스트레이터 등)에서 이벤트 루프를 막지 않도록
+WorkflowFacade 의 동기 호출을 워커 스레드로 넘겨 실행합니다.
+HTTP 세션과 커넥션 풀은 내부 WorkflowFacade 의 것을 그대로 재사용합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+from jira_branch_creator.config import AppConfig
+from jira_branch_creator.facades.workflow_facade import WorkflowFacade, WorkflowResult
+
+
+class AsyncWorkflowFacade:
+    """WorkflowFacade 의 async 래퍼.
+
+    단건 작업은 asyncio.to_thread 로 실행하고, 일괄 작업은 TaskGroup 으로 펼치되
+    동시 실행 수를 AppConfig.max_workers 로 제한합니다.
+    """
+
+    def __init__(self, config: AppConfig) -> None:
+        self._config = config
+        self._facade = WorkflowFacade(config)
+
+    async def create_branch_from_issue(
+        self,
+        issue_key: str,
+        ref: str | None = None,
+    ) -> WorkflowResult:
+        """WorkflowFacade.create_branch_from_issue 의 async 버전."""
+        return await asyncio.to_thread(self._facade.create_branch_from_issue, issue_key, ref)
+
+    async def create_issue_and_branch(
+        self,
+        summary: str,
+        issue_type: str = "Task",
+        description: str = "",
+        labels: list[str] | None = None,
+        transition_to: str | None = None,
+        ref: str | None = None,
+    ) -> WorkflowResult:
+        """WorkflowFacade.create_issue_and_branch 의 async 버전."""
+        return await asyncio.to_thread(
+            self._facade.create_issue_and_branch,
+            summary,
+            issue_type=issue_type,
+            description=description,
+            labels=labels,
+            transition_to=transition_to,
+            ref=ref,
+        )
+
+    async def transition_issue(self, issue_key: str, target_status: str) -> WorkflowResult:
+        """WorkflowFacade.transition_issue 의 async 버전."""
+        return await asyncio.to_thread(self._facade.transition_issue, issue_key, target_status)
+
+    async def get_available_transitions(self, issue_key: str) -> list[str]:
+        """WorkflowFacade.get_available_transitions 의 async 버전."""
+        return await asyncio.to_thread(self._facade.get_available_transitions, issue_key)
+
+    async def preview_branch_name(self, issue_key: str) -> str:
+        """WorkflowFacade.preview_branch_name 의 async 버전."""
+        return await asyncio.to_thread(self._facade.preview_branch_name, issue_key)
+
+    async def create_branches_from_issues(
+        self,
+        issue_keys: Sequence[str],
+        ref: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[WorkflowResult]:
+        """여러 기존 이슈에서 브랜치를 동시에 생성합니다.
+
+        Args:
+            issue_keys: Jira 이슈 키 목록.
+            ref: 기준 브랜치 (None이면 설정의 기본값 사용).
+            max_workers: 동시 작업 수 (None이면 AppConfig.max_workers).
+
+        Returns:
+            issue_keys 순서와 같은 워크플로우 결과 목록.
+
+        Raises:
+            ExceptionGroup: 하나 이상의 작업이 실패했을 때 (TaskGroup 규칙).
+        """
+        limit = asyncio.Semaphore(max_workers or self._config.max_workers)
+
+        async def run(key: str) -> WorkflowResult:
+            async with limit:
+                return await self.create_branch_from_issue(key, ref)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run(key)) for key in issue_keys]
+        return [task.result() for task in tasks]
@@ -10,10 +10,15 @@ JiraService와 GitLabService를 조합하여 고수준 워크플로우를 제공
 
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TypeVar
 
-from jira_branch_creator.config import AppConfig
+from jira_branch_creator.config import AppConfig, GitLabConfig, JiraConfig
+from jira_branch_creator.exceptions import JiraBranchCreatorError
 from jira_branch_creator.models.issue import BranchInfo, CreateIssueRequest, JiraIssue
 from jira_branch_creator.services.gitlab_service import GitLabService
 from jira_branch_creator.services.jira_service import JiraService
@@ -21,14 +26,31 @@ from jira_branch_creator.utils.branch_naming import generate_branch_name
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
 
-@dataclass(frozen=True)
+
+@functools.lru_cache(maxsize=4)
+def _shared_services(
+    jira: JiraConfig,
+    gitlab: GitLabConfig,
+) -> tuple[JiraService, GitLabService]:
+    """설정별로 서비스 인스턴스를 하나씩 만들어 공유합니다.
+
+    Facade 를 요청마다 새로 만들어도 HTTP 커넥션 풀과 조회 캐시가 유지됩니다.
+    설정은 불변으로 취급합니다. Facade 밖에서는 WorkflowFacade.jira 로 접근하세요.
+    """
+    return JiraService(jira), GitLabService(gitlab)
+
+
+@dataclass(frozen=True, slots=True)
 class WorkflowResult:
     """워크플로우 실행 결과."""
 
     issue: JiraIssue
     branch: BranchInfo | None = None
     message: str = ""
+    error: JiraBranchCreatorError | None = None
 
 
 class WorkflowFacade:
@@ -38,12 +60,17 @@ class WorkflowFacade:
         - 이슈에서 브랜치 생성
         - 이슈 생성 후 브랜치 생성
         - 이슈 상태 전환
+        - 위 작업의 일괄 병렬 실행
     """
 
     def __init__(self, config: AppConfig) -> None:
         self._config = config
-        self._jira = JiraService(config.jira)
-        self._gitlab = GitLabService(config.gitlab)
+        self._jira, self._gitlab = _shared_services(config.jira, config.gitlab)
+
+    @property
+    def jira(self) -> JiraService:
+        """Facade 가 쓰는 (설정별로 공유되는) JiraService. 직접 조회가 필요한 호출자용."""
+        return self._jira
 
     # ─── 워크플로우 1: 기존 이슈에서 브랜치 생성 ──────────────────────────
 
@@ -65,17 +92,20 @@ class WorkflowFacade:
         Returns:
             이슈 정보와 생성된 브랜치 정보.
         """
-        issue = self._jira.get_issue(issue_key)
+        return self._branch_issue(self._jira.get_issue(issue_key), ref)
+
+    def _branch_issue(self, issue: JiraIssue, ref: str | None) -> WorkflowResult:
+        """조회된 이슈로 브랜치명을 만들고 GitLab 에 브랜치를 생성합니다."""
         branch_name = generate_branch_name(issue, self._config.branch_naming)
         branch = self._gitlab.create_branch(
             branch_name=branch_name,
             ref=ref,
-            issue_key=issue_key,
+            issue_key=issue.key,
         )
 
         logger.info(
             "워크플로우 완료: %s → %s",
-            issue_key,
+            issue.key,
             branch.name,
         )
         return WorkflowResult(
@@ -119,11 +149,29 @@ class WorkflowFacade:
             description=description,
             labels=labels or [],
         )
-        issue = self._jira.create_issue(request)
+        # 결과로 보여줄 상태와 Jira 기준 이슈 타입명을 채우기 위해 마지막 쓰기 이후 한 번만 다시 조회
+        # (전환이 이어지면 전환 뒤에, 아니면 생성 직후에)
+        issue = self._jira.create_issue(request, fetch_full=not transition_to)
         logger.info("이슈 생성: %s (%s)", issue.key, issue.summary)
+        return self._branch_new_issue(issue, transition_to, ref, fetch_full=True)
 
+    def _branch_new_issue(
+        self,
+        issue: JiraIssue,
+        transition_to: str | None,
+        ref: str | None,
+        fetch_full: bool = False,
+    ) -> WorkflowResult:
+        """생성된 이슈를 (선택) 전환하고 브랜치를 만듭니다.
+
+        fetch_full 이면 전환 후 이슈를 다시 조회해 결과에 담고,
+        아니면 알고 있는 이슈 정보에 새 상태만 반영합니다.
+        """
         if transition_to:
-            issue = self._jira.transition_issue(issue.key, transition_to)
+            transitioned = self._jira.transition_issue(
+                issue.key, transition_to, fetch_full=fetch_full,
+            )
+            issue = transitioned if fetch_full else replace(issue, status=transitioned.status)
             logger.info("이슈 상태 전환: %s → %s", issue.key, transition_to)
 
         branch_name = generate_branch_name(issue, self._config.branch_naming)
@@ -147,6 +195,114 @@ class WorkflowFacade:
             ),
         )
 
+    # ─── 일괄 워크플로우 ──────────────────────────────────────────────────
+
+    def _map_parallel(
+        self,
+        fn: Callable[[T], R],
+        items: Sequence[T],
+        max_workers: int | None,
+    ) -> list[R]:
+        """fn 을 스레드 풀에서 병렬 실행하고 입력 순서대로 결과를 모읍니다.
+
+        항목별 실패는 fn 이 결과(WorkflowResult.error)로 돌려줘야 합니다. fn 에서 빠져나온
+        예외는 나머지 작업이 끝난 뒤 입력 순서상 첫 예외로 다시 발생합니다.
+        """
+        workers = max_workers or self._config.max_workers
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(items)))) as ex:
+            return list(ex.map(fn, items))
+
+    def create_branches_from_issues(
+        self,
+        issue_keys: Sequence[str],
+        ref: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[WorkflowResult]:
+        """여러 기존 이슈에서 브랜치를 병렬로 생성합니다.
+
+        Args:
+            issue_keys: Jira 이슈 키 목록.
+            ref: 기준 브랜치 (None이면 설정의 기본값 사용).
+            max_workers: 동시 작업 수 (None이면 AppConfig.max_workers).
+                Jira/GitLab 요청 한도를 넘지 않도록 조정하세요.
+
+        Returns:
+            issue_keys 와 같은 길이·순서의 결과 목록. 실패한 항목도 빠지지 않고
+            branch=None 에 error 가 채워진 결과로 들어가므로, 다른 항목에서 이미
+            만든 브랜치가 결과에서 사라지지 않습니다. 이슈 조회에 실패한 항목은
+            issue 에 키만 채워집니다.
+        """
+        if not issue_keys:
+            return []
+
+        def run(key: str) -> WorkflowResult:
+            try:
+                issue = self._jira.get_issue(key)
+            except JiraBranchCreatorError as e:
+                logger.error("이슈 %s 조회 실패: %s", key, e)
+                return WorkflowResult(
+                    issue=JiraIssue(key=key, summary="", issue_type=""),
+                    message=f"이슈 '{key}'을(를) 조회하지 못했습니다: {e}",
+                    error=e,
+                )
+            try:
+                return self._branch_issue(issue, ref)
+            except JiraBranchCreatorError as e:
+                logger.error("이슈 %s 브랜치 생성 실패: %s", key, e)
+                return WorkflowResult(
+                    issue=issue,
+                    message=f"이슈 '{key}'의 브랜치를 만들지 못했습니다: {e}",
+                    error=e,
+                )
+
+        return self._map_parallel(run, issue_keys, max_workers)
+
+    def create_issues_and_branches(
+        self,
+        requests: Sequence[CreateIssueRequest],
+        transition_to: str | None = None,
+        ref: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[WorkflowResult | None]:
+        """여러 이슈를 bulk API로 생성하고 각각의 브랜치를 병렬로 생성합니다.
+
+        이슈 생성은 JiraService.create_issues_bulk 로 50개 단위 요청에 묶고,
+        이후 전환/브랜치 생성만 스레드 풀에서 병렬로 실행합니다.
+
+        Args:
+            requests: 이슈 생성 요청 목록.
+            transition_to: 생성 후 전환할 상태명 (선택).
+            ref: 기준 브랜치 (None이면 설정의 기본값 사용).
+            max_workers: 동시 작업 수 (None이면 AppConfig.max_workers).
+
+        Returns:
+            requests 와 같은 길이·순서의 결과 목록.
+            이슈 생성에 실패한 항목은 None 이고, 이슈는 생성됐지만 전환/브랜치 생성에
+            실패한 항목은 branch=None 에 error 가 채워진 결과입니다.
+        """
+        if not requests:
+            return []
+
+        issues = self._jira.create_issues_bulk(requests)
+        created = [issue for issue in issues if issue is not None]
+        if not created:
+            return [None] * len(issues)
+
+        def run(issue: JiraIssue) -> WorkflowResult:
+            try:
+                return self._branch_new_issue(issue, transition_to, ref)
+            except JiraBranchCreatorError as e:
+                # 이미 생성된 Jira 이슈가 결과에서 사라지지 않도록 오류를 담아 반환
+                logger.error("이슈 %s 후속 작업 실패: %s", issue.key, e)
+                return WorkflowResult(
+                    issue=issue,
+                    message=f"이슈 '{issue.key}'은(는) 생성됐지만 브랜치를 만들지 못했습니다: {e}",
+                    error=e,
+                )
+
+        results = iter(self._map_parallel(run, created, max_workers))
+        return [None if issue is None else next(results) for issue in issues]
+
     # ─── 워크플로우 3: 이슈 상태 전환만 ──────────────────────────────────
 
     def transition_issue(
@@ -163,7 +319,7 @@ class WorkflowFacade:
         Returns:
             상태가 전환된 이슈 정보.
         """
-        issue = self._jira.transition_issue(issue_key, target_status)
+        issue = self._jira.transition_issue(issue_key, target_status, fetch_full=True)
 
         return WorkflowResult(
             issue=issue,
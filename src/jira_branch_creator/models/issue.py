@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JiraIssue:
     """Jira 이슈 정보."""
 
@@ -26,7 +26,7 @@ class JiraIssue:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransitionInfo:
     """Jira 이슈 상태 전환 정보."""
 
@@ -44,7 +44,7 @@ class TransitionInfo:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BranchInfo:
     """GitLab 브랜치 정보."""
 
@@ -54,7 +54,7 @@ class BranchInfo:
     web_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateIssueRequest:
     """Jira 이슈 생성 요청."""
 
@@ -7,42 +7,58 @@ GitLab API v4 사용: https://docs.gitlab.com/ee/api/branches.html
 from __future__ import annotations
 
 import logging
+import time
+from urllib.parse import quote
 
 import requests
 
 from jira_branch_creator.config import GitLabConfig
 from jira_branch_creator.exceptions import BranchAlreadyExistsError, GitLabApiError
 from jira_branch_creator.models.issue import BranchInfo
+from jira_branch_creator.utils.http import build_pooled_session, encode_json_body
+from jira_branch_creator.utils.json_codec import json_loads
 
 logger = logging.getLogger(__name__)
 
 
+def _error_message(resp: requests.Response) -> str:
+    """GitLab 오류 응답의 message 필드를 꺼냅니다 (JSON 이 아니면 본문 앞부분)."""
+    try:
+        message = json_loads(resp.content).get("message", "")
+    except (ValueError, AttributeError):
+        return resp.text[:200]
+    return message if isinstance(message, str) else str(message)
+
+
 class GitLabService:
     """GitLab REST API를 캡슐화하는 서비스 클래스."""
 
     def __init__(self, config: GitLabConfig) -> None:
         self._config = config
         self._session = self._build_session()
+        # 프로젝트 API 기본 URL (요청마다 다시 조합하지 않도록 한 번만 생성).
+        # "group/project" 형태의 경로 ID 도 쓸 수 있도록 인코딩합니다.
+        self._project_api_url = (
+            f"{config.base_url}/api/v4/projects/{quote(config.project_id, safe='')}"
+        )
+        # branch_name → (확인 시각 monotonic, 존재 여부). 브랜치 생성 시 갱신합니다.
+        self._exists_cache: dict[str, tuple[float, bool]] = {}
 
     def _build_session(self) -> requests.Session:
-        """인증이 설정된 HTTP 세션을 생성합니다."""
-        session = requests.Session()
+        """인증과 커넥션 풀이 설정된 HTTP 세션을 생성합니다."""
+        session = build_pooled_session(self._config.pool_size)
         session.headers.update({
             "PRIVATE-TOKEN": self._config.token,
             "Content-Type": "application/json",
         })
         return session
 
-    @property
-    def _project_api_url(self) -> str:
-        """프로젝트 API 기본 URL."""
-        return (
-            f"{self._config.base_url}/api/v4"
-            f"/projects/{self._config.project_id}"
-        )
-
     def _request(self, method: str, path: str, **kwargs) -> dict:
-        """GitLab API 요청을 수행하고, 에러를 처리합니다."""
+        """GitLab API 요청을 수행하고, 에러를 처리합니다.
+
+        ``json=`` 페이로드는 encode_json_body 로 직렬화해 본문(bytes)으로 보냅니다.
+        """
+        payload = encode_json_body(kwargs)
         url = f"{self._project_api_url}{path}"
         logger.debug("%s %s", method, url)
 
@@ -53,9 +69,9 @@ class GitLabService:
         except requests.Timeout as e:
             raise GitLabApiError("GitLab API 요청 시간 초과 (30초)") from e
 
-        if resp.status_code == 400 and "already exists" in resp.text.lower():
+        if resp.status_code == 400 and "already exists" in _error_message(resp).lower():
             raise BranchAlreadyExistsError(
-                f"브랜치가 이미 존재합니다: {kwargs.get('json', {}).get('branch', '')}"
+                f"브랜치가 이미 존재합니다: {(payload or {}).get('branch', '')}"
             )
 
         if not resp.ok:
@@ -65,7 +81,7 @@ class GitLabService:
                 status_code=resp.status_code,
             )
 
-        return resp.json()
+        return json_loads(resp.content)
 
     # ─── 브랜치 생성 ────────────────────────────────────────────────────
 
@@ -91,11 +107,16 @@ class GitLabService:
         """
         ref = ref or self._config.default_branch
 
-        data = self._request(
-            "POST",
-            "/repository/branches",
-            json={"branch": branch_name, "ref": ref},
-        )
+        try:
+            data = self._request(
+                "POST",
+                "/repository/branches",
+                json={"branch": branch_name, "ref": ref},
+            )
+        except BranchAlreadyExistsError:
+            self._exists_cache[branch_name] = (time.monotonic(), True)
+            raise
+        self._exists_cache[branch_name] = (time.monotonic(), True)
 
         web_url = data.get("web_url", "")
         logger.info("브랜치 생성 완료: %s (ref: %s)", branch_name, ref)
@@ -112,15 +133,25 @@ class GitLabService:
     def branch_exists(self, branch_name: str) -> bool:
         """브랜치가 존재하는지 확인합니다.
 
+        본문이 없는 HEAD 요청을 사용하며, GitLabConfig.branch_cache_ttl 초 동안은
+        직전 확인 결과를 재사용합니다.
+
         Args:
             branch_name: 확인할 브랜치명.
 
         Returns:
             존재 여부.
         """
-        url = f"{self._project_api_url}/repository/branches/{branch_name}"
+        cached = self._exists_cache.get(branch_name)
+        if cached and time.monotonic() - cached[0] < self._config.branch_cache_ttl:
+            return cached[1]
+
+        # feature/SSCVE-1 처럼 '/'가 포함된 브랜치명은 %2F 로 인코딩해야 GitLab 이 단일 경로 세그먼트로 인식
+        url = f"{self._project_api_url}/repository/branches/{quote(branch_name, safe='')}"
         try:
-            resp = self._session.get(url, timeout=30)
-            return resp.status_code == 200
+            resp = self._session.head(url, timeout=30, allow_redirects=False)
         except requests.RequestException:
             return False
+        exists = resp.status_code == 200
+        self._exists_cache[branch_name] = (time.monotonic(), exists)
+        return exists
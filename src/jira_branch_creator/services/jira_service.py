@@ -7,6 +7,8 @@ Jira REST API v3 사용: https://developer.atlassian.com/cloud/jira/platform/res
 from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Sequence
 
 import requests
 
@@ -21,9 +23,23 @@ from jira_branch_creator.models.issue import (
     JiraIssue,
     TransitionInfo,
 )
+from jira_branch_creator.utils.http import build_pooled_session, encode_json_body
+from jira_branch_creator.utils.json_codec import json_loads
 
 logger = logging.getLogger(__name__)
 
+# /rest/api/3/issue/bulk 한 번에 생성 가능한 최대 이슈 수
+BULK_CREATE_SIZE = 50
+
+
+def _adf_paragraph(text: str) -> dict:
+    """일반 텍스트를 단일 문단 ADF(Atlassian Document Format) 문서로 감쌉니다."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
 
 class JiraService:
     """Jira REST API를 캡슐화하는 서비스 클래스."""
@@ -31,10 +47,14 @@ class JiraService:
     def __init__(self, config: JiraConfig) -> None:
         self._config = config
         self._session = self._build_session()
+        # issue_key → (조회 시각 monotonic, 전환 목록, 소문자 전환명 → 전환). 전환 성공 시 해당 키를 무효화합니다.
+        self._transitions_cache: dict[
+            str, tuple[float, list[TransitionInfo], dict[str, TransitionInfo]]
+        ] = {}
 
     def _build_session(self) -> requests.Session:
-        """인증이 설정된 HTTP 세션을 생성합니다."""
-        session = requests.Session()
+        """인증과 커넥션 풀이 설정된 HTTP 세션을 생성합니다."""
+        session = build_pooled_session(self._config.pool_size)
         session.auth = (self._config.email, self._config.api_token)
         session.headers.update({
             "Accept": "application/json",
@@ -43,7 +63,11 @@ class JiraService:
         return session
 
     def _request(self, method: str, path: str, **kwargs) -> dict:
-        """Jira API 요청을 수행하고, 에러를 처리합니다."""
+        """Jira API 요청을 수행하고, 에러를 처리합니다.
+
+        ``json=`` 페이로드는 encode_json_body 로 직렬화해 본문(bytes)으로 보냅니다.
+        """
+        encode_json_body(kwargs)
         url = f"{self._config.base_url}{path}"
         logger.debug("%s %s", method, url)
 
@@ -68,7 +92,7 @@ class JiraService:
 
         if resp.status_code == 204:
             return {}
-        return resp.json()
+        return json_loads(resp.content)
 
     # ─── 이슈 조회 ──────────────────────────────────────────────────────
 
@@ -95,60 +119,137 @@ class JiraService:
 
     # ─── 이슈 생성 ──────────────────────────────────────────────────────
 
-    def create_issue(self, request: CreateIssueRequest) -> JiraIssue:
+    def create_issue(
+        self,
+        request: CreateIssueRequest,
+        fetch_full: bool = False,
+    ) -> JiraIssue:
         """새로운 Jira 이슈를 생성합니다.
 
         Args:
             request: 이슈 생성 요청 정보.
+            fetch_full: True면 생성 후 이슈를 다시 조회해 상태까지 채웁니다.
 
         Returns:
-            생성된 이슈 정보.
+            생성된 이슈 정보. 기본값에서는 요청 값과 응답의 키로 구성하며
+            status는 비어 있습니다.
 
         Raises:
             JiraApiError: API 호출 실패 시.
         """
-        payload = {
-            "fields": {
-                "project": {"key": request.project_key},
-                "summary": request.summary,
-                "issuetype": {"name": request.issue_type},
-            }
+        payload = {"fields": self._issue_fields(request)}
+        data = self._request("POST", "/rest/api/3/issue", json=payload)
+        issue_key = data["key"]
+        logger.info("이슈 생성 완료: %s", issue_key)
+
+        if fetch_full:
+            return self.get_issue(issue_key)
+        return JiraIssue(
+            key=issue_key,
+            summary=request.summary,
+            issue_type=request.issue_type,
+            project_key=request.project_key,
+        )
+
+    def create_issues_bulk(
+        self,
+        issue_requests: Sequence[CreateIssueRequest],
+    ) -> list[JiraIssue | None]:
+        """여러 이슈를 bulk API로 생성합니다 (요청 BULK_CREATE_SIZE 개당 1회 호출).
+
+        Args:
+            issue_requests: 이슈 생성 요청 목록.
+
+        Returns:
+            issue_requests 와 같은 순서의 이슈 목록. 생성에 실패한 항목은 None 입니다.
+
+        Raises:
+            JiraApiError: 요청 단위 오류(인증, 서버 오류 등) 시.
+        """
+        created: list[JiraIssue | None] = []
+        for start in range(0, len(issue_requests), BULK_CREATE_SIZE):
+            chunk = issue_requests[start:start + BULK_CREATE_SIZE]
+            payload = {"issueUpdates": [{"fields": self._issue_fields(r)} for r in chunk]}
+            try:
+                data = self._request("POST", "/rest/api/3/issue/bulk", json=payload)
+            except JiraApiError as e:
+                # 청크 전체가 검증에 실패하면 400 으로 응답하므로 해당 청크만 실패 처리
+                if e.status_code != 400:
+                    raise
+                logger.error("이슈 일괄 생성 실패 (%d-%d): %s", start, start + len(chunk) - 1, e)
+                created.extend([None] * len(chunk))
+                continue
+
+            # issues 에는 성공한 항목만 요청 순서대로 담기고, 실패 항목은 errors[].failedElementNumber 로 표시됨
+            errors = data.get("errors", [])
+            failed = {err.get("failedElementNumber") for err in errors}
+            for err in errors:
+                logger.error(
+                    "이슈 일괄 생성 오류 (#%s): %s",
+                    err.get("failedElementNumber"),
+                    err.get("elementErrors"),
+                )
+            issues = iter(data.get("issues", []))
+            for i, request in enumerate(chunk):
+                item = None if i in failed else next(issues, None)
+                created.append(
+                    JiraIssue(
+                        key=item["key"],
+                        summary=request.summary,
+                        issue_type=request.issue_type,
+                        project_key=request.project_key,
+                    )
+                    if item else None
+                )
+
+        logger.info(
+            "이슈 일괄 생성 완료: %d/%d",
+            sum(issue is not None for issue in created),
+            len(issue_requests),
+        )
+        return created
+
+    @staticmethod
+    def _issue_fields(request: CreateIssueRequest) -> dict:
+        """이슈 생성 요청을 Jira fields 페이로드로 변환합니다."""
+        fields = {
+            "project": {"key": request.project_key},
+            "summary": request.summary,
+            "issuetype": {"name": request.issue_type},
         }
 
         if request.description:
-            payload["fields"]["description"] = {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {"type": "text", "text": request.description}
-                        ],
-                    }
-                ],
-            }
+            fields["description"] = _adf_paragraph(request.description)
 
         if request.labels:
-            payload["fields"]["labels"] = request.labels
-
-        data = self._request("POST", "/rest/api/3/issue", json=payload)
-        issue_key = data["key"]
-        logger.info("이슈 생성 완료: %s", issue_key)
+            fields["labels"] = request.labels
 
-        return self.get_issue(issue_key)
+        return fields
 
     # ─── 상태 전환 ──────────────────────────────────────────────────────
 
     def get_transitions(self, issue_key: str) -> list[TransitionInfo]:
         """이슈에서 가능한 상태 전환 목록을 조회합니다.
 
+        JiraConfig.transitions_cache_ttl 초 동안은 직전 조회 결과를 재사용합니다.
+
         Args:
             issue_key: 이슈 키 (예: "SSCVE-123").
 
         Returns:
             가능한 상태 전환 목록.
         """
+        return list(self._load_transitions(issue_key)[0])
+
+    def _load_transitions(
+        self,
+        issue_key: str,
+    ) -> tuple[list[TransitionInfo], dict[str, TransitionInfo]]:
+        """전환 목록과 소문자 전환명 색인을 캐시에서 가져오거나 새로 조회합니다."""
+        cached = self._transitions_cache.get(issue_key)
+        if cached and time.monotonic() - cached[0] < self._config.transitions_cache_ttl:
+            return cached[1], cached[2]
+
         data = self._request(
             "GET",
             f"/rest/api/3/issue/{issue_key}/transitions",
@@ -162,7 +263,11 @@ class JiraService:
             issue_key,
             [t.name for t in transitions],
         )
-        return transitions
+        by_name: dict[str, TransitionInfo] = {}
+        for t in transitions:
+            by_name.setdefault(t.name.lower(), t)  # 이름이 겹치면 목록상 첫 전환 사용
+        self._transitions_cache[issue_key] = (time.monotonic(), transitions, by_name)
+        return transitions, by_name
 
     def search_recent_issues(
         self,
@@ -199,27 +304,28 @@ class JiraService:
         logger.debug("최근 %d분 이슈 %d개 조회 (%s)", minutes, len(issues), project_key)
         return issues
 
-    def transition_issue(self, issue_key: str, target_status: str) -> JiraIssue:
+    def transition_issue(
+        self,
+        issue_key: str,
+        target_status: str,
+        fetch_full: bool = False,
+    ) -> JiraIssue:
         """이슈의 상태를 전환합니다.
 
         Args:
             issue_key: 이슈 키 (예: "SSCVE-123").
             target_status: 전환할 상태명 (예: "진행 중", "In Progress").
+            fetch_full: True면 전환 후 이슈를 다시 조회해 요약/타입까지 채웁니다.
 
         Returns:
-            상태가 전환된 이슈 정보.
+            상태가 전환된 이슈 정보. 기본값에서는 key/status/project_key만 채워집니다.
 
         Raises:
             TransitionNotFoundError: 해당 상태로 전환할 수 없을 때.
             JiraApiError: API 호출 실패 시.
         """
-        transitions = self.get_transitions(issue_key)
-        target_lower = target_status.lower()
-
-        matched = next(
-            (t for t in transitions if t.name.lower() == target_lower),
-            None,
-        )
+        transitions, by_name = self._load_transitions(issue_key)
+        matched = by_name.get(target_status.lower())
 
         if not matched:
             available = [f"'{t.name}'" for t in transitions]
@@ -233,6 +339,15 @@ class JiraService:
             f"/rest/api/3/issue/{issue_key}/transitions",
             json={"transition": {"id": matched.id}},
         )
+        self._transitions_cache.pop(issue_key, None)
         logger.info("이슈 %s 상태 전환 완료: %s", issue_key, target_status)
 
-        return self.get_issue(issue_key)
+        if fetch_full:
+            return self.get_issue(issue_key)
+        return JiraIssue(
+            key=issue_key,
+            summary="",
+            issue_type="",
+            status=matched.to_status or matched.name,
+            project_key=issue_key.split("-")[0],
+        )
@@ -27,7 +27,6 @@ except ImportError as e:
 from jira_branch_creator.config import AppConfig, load_config
 from jira_branch_creator.exceptions import JiraBranchCreatorError
 from jira_branch_creator.facades.workflow_facade import WorkflowFacade
-from jira_branch_creator.services.jira_service import JiraService
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +76,8 @@ class TrayApp:
     def __init__(self, config: AppConfig) -> None:
         self._config = config
         self._facade = WorkflowFacade(config)
-        self._jira = JiraService(config.jira)
+        # Facade 와 같은 JiraService 를 써서 커넥션 풀과 조회 캐시를 공유합니다.
+        self._jira = self._facade.jira
         self._watching = False
         self._watch_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
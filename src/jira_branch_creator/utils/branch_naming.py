@@ -4,30 +4,30 @@ Jira 이슈 타입과 요약을 기반으로 컨벤션에 맞는 브랜치명을
 규칙: {prefix}/{ISSUE_KEY}-{summary-slug}
 """
 
-import re
+import functools
+import string
 
-from jira_branch_creator.config import BranchNamingConfig
+from jira_branch_creator.config import DEFAULT_PREFIXES, BranchNamingConfig
 from jira_branch_creator.models.issue import JiraIssue
 
 DEFAULT_PREFIX = "feature"
 
+# 같은 prefix 키를 쓰는 이슈 타입 별칭 (소문자 기준).
+_TYPE_ALIASES = {"sub-task": "subtask"}
+
+# 바이트 단위 슬러그 치환 테이블: 영문 소문자/숫자는 그대로, 나머지 바이트는 모두 '-'.
+_SLUG_KEEP = (string.ascii_lowercase + string.digits).encode("ascii")
+_SLUG_TABLE = bytes(b if b in _SLUG_KEEP else ord("-") for b in range(256))
+
 
 def _resolve_prefix(issue_type: str, config: BranchNamingConfig) -> str:
-    """이슈 타입에 따른 브랜치 prefix를 결정합니다."""
+    """이슈 타입에 따른 브랜치 prefix를 결정합니다.
+
+    사용자 prefix_map 에 없는 타입은 기본 prefix 표로, 그마저 없으면 DEFAULT_PREFIX 로 대체합니다.
+    """
     normalized = issue_type.lower().strip()
-    match normalized:
-        case "bug":
-            return config.prefixes.get("bug", "bugfix")
-        case "story":
-            return config.prefixes.get("story", "feature")
-        case "task":
-            return config.prefixes.get("task", "task")
-        case "epic":
-            return config.prefixes.get("epic", "epic")
-        case "subtask" | "sub-task":
-            return config.prefixes.get("subtask", "feature")
-        case _:
-            return config.prefixes.get(normalized, DEFAULT_PREFIX)
+    key = _TYPE_ALIASES.get(normalized, normalized)
+    return config.prefixes.get(key, DEFAULT_PREFIXES.get(key, DEFAULT_PREFIX))
 
 
 def _slugify(text: str, max_length: int) -> str:
@@ -36,17 +36,22 @@ def _slugify(text: str, max_length: int) -> str:
     영문/숫자만 유지하고, 나머지는 하이픈으로 치환합니다.
     한글만 있는 경우 빈 문자열을 반환합니다.
     """
-    slug = text.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = slug.strip("-")
+    # 비 ASCII 문자는 '?' 한 바이트로 바꾼 뒤 테이블에서 '-'가 되므로 정규식
+    # [^a-z0-9]+ 치환과 결과가 같습니다. 연속 하이픈 축약과 양끝 제거는 split/join 한 번으로 처리합니다.
+    raw = text.lower().encode("ascii", "replace").translate(_SLUG_TABLE)
+    slug = "-".join(filter(None, raw.decode("ascii").split("-")))
     if len(slug) > max_length:
         slug = slug[:max_length].rstrip("-")
     return slug
 
 
+@functools.lru_cache(maxsize=512)
 def generate_branch_name(issue: JiraIssue, config: BranchNamingConfig) -> str:
     """Jira 이슈 정보로부터 브랜치명을 생성합니다.
 
+    (issue, config) 에 대한 순수 함수이므로 결과를 캐시합니다. 미리보기 → 생성처럼
+    같은 이슈를 반복 처리할 때 슬러그 계산을 다시 하지 않습니다.
+
     Args:
         issue: Jira 이슈 정보.
         config: 브랜치 네이밍 설정.
@@ -0,0 +1,50 @@
+"""HTTP 세션 유틸리티.
+
+Jira/GitLab 서비스가 공통으로 쓰는 커넥션 풀 세션 생성과 JSON 본문 직렬화를 제공합니다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from jira_branch_creator.utils.json_codec import json_dumps
+
+
+def build_pooled_session(pool_size: int) -> requests.Session:
+    """커넥션 풀과 재시도 정책이 설정된 HTTP 세션을 생성합니다.
+
+    재시도는 멱등 요청(GET/HEAD)의 일시적 5xx 에만 적용합니다.
+    POST 는 중복 생성 위험이 있어 재시도하지 않습니다.
+    인증과 공통 헤더는 호출하는 서비스에서 설정합니다.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def encode_json_body(kwargs: dict[str, Any]) -> Any:
+    """요청 kwargs 의 ``json=`` 페이로드를 json_dumps 로 직렬화해 ``data=`` 로 옮깁니다.
+
+    Returns:
+        꺼낸 원본 페이로드 (없으면 None). 오류 메시지 구성 등에 사용합니다.
+    """
+    payload = kwargs.pop("json", None)
+    if payload is not None:
+        kwargs["data"] = json_dumps(payload)
+    return payload
@@ -0,0 +1,20 @@
+"""JSON 직렬화/파싱 유틸리티.
+
+orjson 이 설치돼 있으면 사용하고 (C 구현, bytes 를 그대로 파싱/반환), 없으면 표준 json 으로 대체합니다.
+"""
+
+import json
+
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    # 구분자 공백 제거, 한글은 이스케이프 없이 UTF-8 로 전송
+    _encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def json_dumps(obj: object) -> bytes:
+        return _encode_json(obj).encode("utf-8")
+
+    json_loads = json.loads  # bytes 입력 허용 (UTF-8 자동 판별)
@@ -0,0 +1,27 @@
+"""테스트 공용 설정/응답 생성 헬퍼."""
+
+import json
+from unittest import mock
+
+from jira_branch_creator.config import AppConfig, BranchNamingConfig, GitLabConfig, JiraConfig
+
+
+def make_config(max_workers: int = 8) -> AppConfig:
+    """외부 서버에 연결하지 않는 테스트용 AppConfig."""
+    return AppConfig(
+        jira=JiraConfig(base_url="https://jira.test", email="a@test", api_token="t"),
+        gitlab=GitLabConfig(base_url="https://gitlab.test", token="t", project_id="1"),
+        branch_naming=BranchNamingConfig(),
+        max_workers=max_workers,
+    )
+
+
+def json_response(status_code: int, body: dict) -> mock.Mock:
+    """requests.Response 대신 쓰는 JSON 응답 mock."""
+    content = json.dumps(body).encode("utf-8")
+    return mock.Mock(
+        status_code=status_code,
+        ok=status_code < 400,
+        content=content,
+        text=content.decode("utf-8"),
+    )
@@ -0,0 +1,80 @@
+"""비동기 워크플로우 Facade 단위 테스트 (동기 WorkflowFacade 는 mock 으로 대체)."""
+
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from jira_branch_creator.facades.async_workflow_facade import AsyncWorkflowFacade
+from jira_branch_creator.facades.workflow_facade import WorkflowResult
+from jira_branch_creator.models.issue import BranchInfo, JiraIssue
+from tests.factories import make_config
+
+
+def _result(key: str) -> WorkflowResult:
+    return WorkflowResult(
+        issue=JiraIssue(key=key, summary="", issue_type="Task"),
+        branch=BranchInfo(name=f"task/{key}", ref="develop", issue_key=key),
+    )
+
+
+class TestAsyncWorkflowFacade(unittest.TestCase):
+    """AsyncWorkflowFacade 테스트."""
+
+    def setUp(self) -> None:
+        self.facade = AsyncWorkflowFacade(make_config(max_workers=2))
+        self.sync = mock.Mock()
+        self.facade._facade = self.sync
+
+    def test_create_issue_and_branch_forwards_keywords_off_loop(self) -> None:
+        """동기 Facade 를 이벤트 루프 밖 스레드에서 같은 인자로 호출."""
+        loop_thread = threading.get_ident()
+        called_in: list[int] = []
+
+        def create(summary: str, **kwargs) -> WorkflowResult:
+            called_in.append(threading.get_ident())
+            return _result("SSCVE-1")
+
+        self.sync.create_issue_and_branch.side_effect = create
+
+        result = asyncio.run(self.facade.create_issue_and_branch(
+            "Fix login", issue_type="Bug", labels=["qa"], transition_to="In Progress",
+        ))
+
+        self.assertEqual(result.issue.key, "SSCVE-1")
+        self.sync.create_issue_and_branch.assert_called_once_with(
+            "Fix login",
+            issue_type="Bug",
+            description="",
+            labels=["qa"],
+            transition_to="In Progress",
+            ref=None,
+        )
+        self.assertNotEqual(called_in, [loop_thread])
+
+    def test_create_branches_from_issues_bounded_and_ordered(self) -> None:
+        """동시 실행 수는 max_workers 이하, 결과는 입력 순서."""
+        lock = threading.Lock()
+        running, peak = 0, 0
+
+        def create(key: str, ref: str | None) -> WorkflowResult:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.02)
+            with lock:
+                running -= 1
+            return _result(key)
+
+        self.sync.create_branch_from_issue.side_effect = create
+        keys = [f"SSCVE-{i}" for i in range(6)]
+
+        results = asyncio.run(self.facade.create_branches_from_issues(keys))
+
+        self.assertEqual([r.issue.key for r in results], keys)
+        self.assertLessEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,6 +50,32 @@ class TestGenerateBranchName(unittest.TestCase):
         result = generate_branch_name(issue, self.config)
         self.assertEqual(result, "feature/SSCVE-606-something-new")
 
+    def test_custom_prefix_map_falls_back_to_defaults(self) -> None:
+        """prefix_map 에 없는 타입은 기본 prefix 사용."""
+        config = BranchNamingConfig(prefix_map={"story": "feat"})
+        story = self._make_issue("SSCVE-607", "New page", "Story")
+        bug = self._make_issue("SSCVE-608", "Crash", "Bug")
+        self.assertEqual(generate_branch_name(story, config), "feat/SSCVE-607-new-page")
+        self.assertEqual(generate_branch_name(bug, config), "bugfix/SSCVE-608-crash")
+
+    def test_prefix_map_is_frozen_for_cached_names(self) -> None:
+        """생성 후 원본 dict 를 바꿔도 캐시 경로의 결과가 설정과 어긋나지 않음."""
+        prefix_map = {"story": "feat"}
+        config = BranchNamingConfig(prefix_map=prefix_map)
+        story = self._make_issue("SSCVE-609", "New page", "Story")
+        self.assertEqual(generate_branch_name(story, config), "feat/SSCVE-609-new-page")
+
+        prefix_map["story"] = "changed"
+        self.assertEqual(config.prefixes["story"], "feat")
+        self.assertEqual(generate_branch_name(story, config), "feat/SSCVE-609-new-page")
+        with self.assertRaises(TypeError):
+            config.prefix_map["story"] = "changed"  # type: ignore[index]
+
+        # 해시는 같아도 prefix_map 이 다른 설정은 캐시 결과를 공유하지 않음
+        changed = BranchNamingConfig(prefix_map=prefix_map)
+        self.assertEqual(hash(changed), hash(config))
+        self.assertEqual(generate_branch_name(story, changed), "changed/SSCVE-609-new-page")
+
     # ─── 슬러그 변환 테스트 ──────────────────────────────────────────────
 
     def test_korean_only_summary(self) -> None:
@@ -64,6 +90,12 @@ class TestGenerateBranchName(unittest.TestCase):
         result = generate_branch_name(issue, self.config)
         self.assertEqual(result, "feature/SSCVE-702-add-oauth2")
 
+    def test_korean_between_words_is_separator(self) -> None:
+        """영문 사이의 한글도 하이픈 구분자로 처리."""
+        issue = self._make_issue("SSCVE-703", "login한글page", "Story")
+        result = generate_branch_name(issue, self.config)
+        self.assertEqual(result, "feature/SSCVE-703-login-page")
+
     def test_special_characters(self) -> None:
         """특수문자는 하이픈으로 치환."""
         issue = self._make_issue("SSCVE-801", "Fix   multiple   spaces!!!", "Bug")
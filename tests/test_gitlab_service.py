@@ -0,0 +1,113 @@
+"""GitLab 서비스 단위 테스트 (HTTP 세션은 mock 으로 대체)."""
+
+import dataclasses
+import unittest
+from unittest import mock
+
+from jira_branch_creator.exceptions import BranchAlreadyExistsError, GitLabApiError
+from jira_branch_creator.services.gitlab_service import GitLabService
+from tests.factories import json_response, make_config
+
+API_URL = "https://gitlab.test/api/v4/projects/1"
+
+
+class GitLabServiceTestCase(unittest.TestCase):
+    """GitLab 서비스 테스트 공통 준비: HTTP 세션을 mock 으로 교체."""
+
+    def setUp(self) -> None:
+        self.service = GitLabService(make_config().gitlab)
+        self.session = mock.Mock()
+        self.service._session = self.session
+
+
+class TestProjectPath(GitLabServiceTestCase):
+    """프로젝트 경로/브랜치명 URL 인코딩 테스트."""
+
+    def test_path_project_id_is_single_segment(self) -> None:
+        """'group/project' 형태의 프로젝트 ID 는 %2F 로 인코딩해 한 세그먼트로 사용."""
+        config = dataclasses.replace(make_config().gitlab, project_id="team/sub group/app")
+        service = GitLabService(config)
+        service._session = self.session
+        self.session.request.return_value = json_response(201, {"web_url": "u"})
+
+        service.create_branch("feature/SSCVE-1", issue_key="SSCVE-1")
+
+        args, _ = self.session.request.call_args
+        self.assertEqual(
+            args,
+            ("POST", "https://gitlab.test/api/v4/projects/team%2Fsub%20group%2Fapp/repository/branches"),
+        )
+
+
+class TestBranchExists(GitLabServiceTestCase):
+    """branch_exists (HEAD + TTL 캐시) 테스트."""
+
+    def test_uses_head_and_caches_result(self) -> None:
+        """본문 없는 HEAD 로 확인하고, TTL 안의 재확인은 요청 없이 캐시 사용."""
+        self.session.head.return_value = mock.Mock(status_code=200)
+
+        self.assertTrue(self.service.branch_exists("feature/SSCVE-1"))
+        self.assertTrue(self.service.branch_exists("feature/SSCVE-1"))
+
+        self.session.head.assert_called_once_with(
+            f"{API_URL}/repository/branches/feature%2FSSCVE-1",
+            timeout=30,
+            allow_redirects=False,
+        )
+        self.session.request.assert_not_called()
+
+    def test_missing_branch_is_cached_until_ttl(self) -> None:
+        """없는 브랜치(404)도 캐시하고, TTL 이 지나면 다시 확인."""
+        self.session.head.return_value = mock.Mock(status_code=404)
+        now = [1000.0]
+
+        with mock.patch(
+            "jira_branch_creator.services.gitlab_service.time.monotonic",
+            side_effect=lambda: now[0],
+        ):
+            self.assertFalse(self.service.branch_exists("feature/SSCVE-2"))
+            now[0] += 1
+            self.assertFalse(self.service.branch_exists("feature/SSCVE-2"))
+            now[0] += self.service._config.branch_cache_ttl
+            self.assertFalse(self.service.branch_exists("feature/SSCVE-2"))
+
+        self.assertEqual(self.session.head.call_count, 2)
+
+    def test_create_branch_updates_cache(self) -> None:
+        """브랜치를 만든 뒤의 확인은 HEAD 없이 True."""
+        self.session.head.return_value = mock.Mock(status_code=404)
+        self.session.request.return_value = json_response(201, {"web_url": "u"})
+
+        self.assertFalse(self.service.branch_exists("feature/SSCVE-3"))
+        self.service.create_branch("feature/SSCVE-3", issue_key="SSCVE-3")
+
+        self.assertTrue(self.service.branch_exists("feature/SSCVE-3"))
+        self.session.head.assert_called_once()
+
+
+class TestCreateBranchErrors(GitLabServiceTestCase):
+    """create_branch 오류 판별 테스트."""
+
+    def test_already_exists_message_raises_specific_error(self) -> None:
+        """400 응답의 JSON message 로 이미 존재하는 브랜치를 판별하고 캐시에 반영."""
+        self.session.request.return_value = json_response(400, {"message": "Branch already exists"})
+
+        with self.assertRaises(BranchAlreadyExistsError) as ctx:
+            self.service.create_branch("feature/SSCVE-4")
+
+        self.assertIn("feature/SSCVE-4", str(ctx.exception))
+        self.assertTrue(self.service.branch_exists("feature/SSCVE-4"))
+        self.session.head.assert_not_called()
+
+    def test_other_400_is_api_error(self) -> None:
+        """message 가 다른 400 은 일반 API 오류."""
+        self.session.request.return_value = json_response(400, {"message": "Invalid reference name"})
+
+        with self.assertRaises(GitLabApiError) as ctx:
+            self.service.create_branch("feature/SSCVE-5", ref="missing")
+
+        self.assertEqual(ctx.exception.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
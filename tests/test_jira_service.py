@@ -0,0 +1,157 @@
+"""Jira 서비스 단위 테스트 (HTTP 세션은 mock 으로 대체)."""
+
+import json
+import unittest
+from unittest import mock
+
+from jira_branch_creator.exceptions import JiraApiError
+from jira_branch_creator.models.issue import CreateIssueRequest
+from jira_branch_creator.services.jira_service import BULK_CREATE_SIZE, JiraService
+from tests.factories import json_response, make_config
+
+
+def _requests(count: int) -> list[CreateIssueRequest]:
+    return [
+        CreateIssueRequest(project_key="SSCVE", summary=f"issue {i}", issue_type="Task")
+        for i in range(count)
+    ]
+
+
+class TestCreateIssuesBulk(unittest.TestCase):
+    """JiraService.create_issues_bulk 테스트."""
+
+    def setUp(self) -> None:
+        self.service = JiraService(make_config().jira)
+        self.session = mock.Mock()
+        self.service._session = self.session
+
+    def _sent_updates(self, call_index: int) -> list[dict]:
+        _, kwargs = self.session.request.call_args_list[call_index]
+        return json.loads(kwargs["data"])["issueUpdates"]
+
+    def test_partial_failure_keeps_positions(self) -> None:
+        """errors[].failedElementNumber 항목만 None, 나머지는 요청 순서대로 키 매핑."""
+        self.session.request.return_value = json_response(201, {
+            "issues": [{"key": "SSCVE-10"}, {"key": "SSCVE-11"}],
+            "errors": [{"failedElementNumber": 1, "elementErrors": {"errors": {"summary": "x"}}}],
+        })
+
+        with self.assertLogs("jira_branch_creator.services.jira_service", "ERROR"):
+            result = self.service.create_issues_bulk(_requests(3))
+
+        self.assertEqual([i and i.key for i in result], ["SSCVE-10", None, "SSCVE-11"])
+        self.assertEqual(result[2].summary, "issue 2")
+        self.assertEqual(result[2].project_key, "SSCVE")
+
+    def test_whole_chunk_400_marks_chunk_failed(self) -> None:
+        """청크 전체가 400 으로 거절되면 그 청크만 None 으로 채우고 다음 청크는 계속."""
+        self.session.request.side_effect = [
+            json_response(400, {"errors": [{"failedElementNumber": 0}]}),
+            json_response(201, {"issues": [{"key": "SSCVE-99"}], "errors": []}),
+        ]
+
+        with self.assertLogs("jira_branch_creator.services.jira_service", "ERROR"):
+            result = self.service.create_issues_bulk(_requests(BULK_CREATE_SIZE + 1))
+
+        self.assertEqual(result[:BULK_CREATE_SIZE], [None] * BULK_CREATE_SIZE)
+        self.assertEqual(result[-1].key, "SSCVE-99")
+
+    def test_non_400_error_propagates(self) -> None:
+        """인증 실패 등 요청 단위 오류는 그대로 발생."""
+        self.session.request.return_value = json_response(401, {"message": "unauthorized"})
+
+        with self.assertRaises(JiraApiError) as ctx:
+            self.service.create_issues_bulk(_requests(2))
+        self.assertEqual(ctx.exception.status_code, 401)
+
+    def test_splits_into_bulk_sized_chunks(self) -> None:
+        """BULK_CREATE_SIZE 단위로 나눠 요청하고 결과를 입력 순서로 이어 붙임."""
+        total = BULK_CREATE_SIZE * 2 + 3
+
+        def respond(method: str, url: str, **kwargs) -> mock.Mock:
+            count = len(json.loads(kwargs["data"])["issueUpdates"])
+            start = respond.offset
+            respond.offset += count
+            return json_response(201, {
+                "issues": [{"key": f"SSCVE-{start + i}"} for i in range(count)],
+                "errors": [],
+            })
+
+        respond.offset = 0
+        self.session.request.side_effect = respond
+
+        result = self.service.create_issues_bulk(_requests(total))
+
+        self.assertEqual(self.session.request.call_count, 3)
+        self.assertEqual(
+            [len(self._sent_updates(i)) for i in range(3)],
+            [BULK_CREATE_SIZE, BULK_CREATE_SIZE, 3],
+        )
+        self.assertEqual([i.key for i in result], [f"SSCVE-{n}" for n in range(total)])
+        self.assertEqual(self._sent_updates(2)[0]["fields"]["summary"], f"issue {BULK_CREATE_SIZE * 2}")
+
+
+
+class TestTransitionsCache(unittest.TestCase):
+    """JiraService 전환 목록 TTL 캐시 테스트."""
+
+    TRANSITIONS = {"transitions": [
+        {"id": "11", "name": "In Progress", "to": {"name": "In Progress"}},
+        {"id": "21", "name": "Done", "to": {"name": "Done"}},
+    ]}
+
+    def setUp(self) -> None:
+        self.service = JiraService(make_config().jira)
+        self.session = mock.Mock()
+        self.session.request.side_effect = self._respond
+        self.service._session = self.session
+        self.now = 1000.0
+        patcher = mock.patch(
+            "jira_branch_creator.services.jira_service.time.monotonic",
+            side_effect=lambda: self.now,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _respond(self, method: str, url: str, **kwargs) -> mock.Mock:
+        if method == "POST":
+            return json_response(204, {})
+        return json_response(200, self.TRANSITIONS)
+
+    def _transition_gets(self) -> int:
+        return sum(
+            1 for args, _ in self.session.request.call_args_list
+            if args == ("GET", "https://jira.test/rest/api/3/issue/SSCVE-1/transitions")
+        )
+
+    def test_reuses_result_within_ttl(self) -> None:
+        """TTL 안에서는 다시 조회하지 않고, 지나면 새로 조회."""
+        first = self.service.get_transitions("SSCVE-1")
+        self.now += 10
+        second = self.service.get_transitions("SSCVE-1")
+
+        self.assertEqual([t.name for t in first], ["In Progress", "Done"])
+        self.assertEqual(first, second)
+        self.assertEqual(self._transition_gets(), 1)
+
+        self.now += self.service._config.transitions_cache_ttl
+        self.service.get_transitions("SSCVE-1")
+        self.assertEqual(self._transition_gets(), 2)
+
+    def test_transition_uses_cache_then_invalidates(self) -> None:
+        """전환은 캐시된 목록으로 id 를 찾고, 성공 후에는 해당 이슈 캐시를 비움."""
+        self.service.get_transitions("SSCVE-1")
+
+        issue = self.service.transition_issue("SSCVE-1", "in progress")
+
+        self.assertEqual(issue.status, "In Progress")
+        self.assertEqual(self._transition_gets(), 1)
+        _, kwargs = self.session.request.call_args
+        self.assertEqual(json.loads(kwargs["data"]), {"transition": {"id": "11"}})
+
+        self.service.get_transitions("SSCVE-1")
+        self.assertEqual(self._transition_gets(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""워크플로우 Facade 단위 테스트 (Jira/GitLab 서비스는 mock 으로 대체)."""
+
+import threading
+import unittest
+from unittest import mock
+
+from jira_branch_creator.exceptions import BranchAlreadyExistsError, IssueNotFoundError
+from jira_branch_creator.facades.workflow_facade import WorkflowFacade
+from jira_branch_creator.models.issue import BranchInfo, CreateIssueRequest, JiraIssue
+from tests.factories import make_config
+
+
+def _branch(branch_name: str, ref: str | None, issue_key: str) -> BranchInfo:
+    return BranchInfo(name=branch_name, ref=ref or "develop", issue_key=issue_key)
+
+
+class WorkflowFacadeTestCase(unittest.TestCase):
+    """Facade 테스트 공통 준비: 서비스 인스턴스를 mock 으로 교체."""
+
+    def setUp(self) -> None:
+        self.facade = WorkflowFacade(make_config())
+        self.jira = mock.Mock()
+        self.gitlab = mock.Mock()
+        self.gitlab.create_branch.side_effect = _branch
+        self.facade._jira = self.jira
+        self.facade._gitlab = self.gitlab
+
+
+class TestCreateIssueAndBranch(WorkflowFacadeTestCase):
+    """create_issue_and_branch 테스트."""
+
+    def test_without_transition_fetches_created_issue(self) -> None:
+        """전환이 없으면 생성 직후 조회한 이슈(상태/타입 포함)를 결과로 사용."""
+        self.jira.create_issue.return_value = JiraIssue(
+            key="SSCVE-1", summary="Fix login", issue_type="Bug", status="To Do",
+        )
+
+        result = self.facade.create_issue_and_branch("Fix login", issue_type="bug")
+
+        _, kwargs = self.jira.create_issue.call_args
+        self.assertTrue(kwargs["fetch_full"])
+        self.jira.transition_issue.assert_not_called()
+        self.assertEqual(result.issue.status, "To Do")
+        self.assertEqual(result.issue.issue_type, "Bug")
+
+    def test_with_transition_fetches_once_after_transition(self) -> None:
+        """전환이 있으면 생성 직후가 아니라 전환 후에 한 번만 조회."""
+        self.jira.create_issue.return_value = JiraIssue(
+            key="SSCVE-2", summary="Add page", issue_type="Story",
+        )
+        self.jira.transition_issue.return_value = JiraIssue(
+            key="SSCVE-2", summary="Add page", issue_type="Story", status="In Progress",
+        )
+
+        result = self.facade.create_issue_and_branch("Add page", transition_to="In Progress")
+
+        _, kwargs = self.jira.create_issue.call_args
+        self.assertFalse(kwargs["fetch_full"])
+        self.jira.transition_issue.assert_called_once_with(
+            "SSCVE-2", "In Progress", fetch_full=True,
+        )
+        self.assertEqual(result.issue.status, "In Progress")
+        self.assertEqual(result.branch.name, "feature/SSCVE-2-add-page")
+
+
+class TestCreateBranchesFromIssues(WorkflowFacadeTestCase):
+    """create_branches_from_issues 테스트."""
+
+    def test_results_keep_input_order(self) -> None:
+        """먼저 끝난 작업과 상관없이 issue_keys 순서대로 결과 반환."""
+        release_first = threading.Event()
+
+        def get_issue(key: str) -> JiraIssue:
+            # 첫 키는 나머지가 모두 끝날 때까지 대기 → 완료 순서가 입력 순서와 다름
+            if key == "SSCVE-1":
+                release_first.wait(timeout=5)
+            elif key == "SSCVE-3":
+                release_first.set()
+            return JiraIssue(key=key, summary=f"Work {key[-1]}", issue_type="Task")
+
+        self.jira.get_issue.side_effect = get_issue
+
+        results = self.facade.create_branches_from_issues(
+            ["SSCVE-1", "SSCVE-2", "SSCVE-3"], max_workers=3,
+        )
+
+        self.assertEqual(
+            [r.branch.name for r in results],
+            ["task/SSCVE-1-work-1", "task/SSCVE-2-work-2", "task/SSCVE-3-work-3"],
+        )
+
+    def test_partial_success_reports_every_item(self) -> None:
+        """일부가 실패해도 나머지 결과(이미 만든 브랜치)는 같은 위치에 남고 실패는 error 로 반환."""
+        not_found = IssueNotFoundError("missing 2")
+        conflict = BranchAlreadyExistsError("exists 3")
+
+        def get_issue(key: str) -> JiraIssue:
+            if key == "SSCVE-2":
+                raise not_found
+            return JiraIssue(key=key, summary=f"Work {key[-1]}", issue_type="Task")
+
+        def create_branch(branch_name: str, ref: str | None, issue_key: str) -> BranchInfo:
+            if issue_key == "SSCVE-3":
+                raise conflict
+            return _branch(branch_name, ref, issue_key)
+
+        self.jira.get_issue.side_effect = get_issue
+        self.gitlab.create_branch.side_effect = create_branch
+
+        with self.assertLogs("jira_branch_creator.facades.workflow_facade", "ERROR"):
+            results = self.facade.create_branches_from_issues(
+                ["SSCVE-1", "SSCVE-2", "SSCVE-3", "SSCVE-4"],
+            )
+
+        self.assertEqual([r.issue.key for r in results], ["SSCVE-1", "SSCVE-2", "SSCVE-3", "SSCVE-4"])
+        self.assertEqual(results[0].branch.name, "task/SSCVE-1-work-1")
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].branch)
+        self.assertIs(results[1].error, not_found)
+        self.assertEqual(results[2].issue.summary, "Work 3")
+        self.assertIsNone(results[2].branch)
+        self.assertIs(results[2].error, conflict)
+        self.assertEqual(results[3].branch.name, "task/SSCVE-4-work-4")
+
+    def test_empty_input(self) -> None:
+        self.assertEqual(self.facade.create_branches_from_issues([]), [])
+        self.jira.get_issue.assert_not_called()
+
+
+class TestCreateIssuesAndBranches(WorkflowFacadeTestCase):
+    """create_issues_and_branches 테스트."""
+
+    def test_results_align_with_requests(self) -> None:
+        """생성 실패는 None, 브랜치 실패는 error 를 담은 결과로 같은 위치에 반환."""
+        requests = [
+            CreateIssueRequest(project_key="SSCVE", summary=s, issue_type="Task")
+            for s in ("first", "second", "third")
+        ]
+        self.jira.create_issues_bulk.return_value = [
+            JiraIssue(key="SSCVE-1", summary="first", issue_type="Task"),
+            None,
+            JiraIssue(key="SSCVE-3", summary="third", issue_type="Task"),
+        ]
+        conflict = BranchAlreadyExistsError("exists")
+
+        def create_branch(branch_name: str, ref: str | None, issue_key: str) -> BranchInfo:
+            if issue_key == "SSCVE-3":
+                raise conflict
+            return _branch(branch_name, ref, issue_key)
+
+        self.gitlab.create_branch.side_effect = create_branch
+
+        with self.assertLogs("jira_branch_creator.facades.workflow_facade", "ERROR"):
+            results = self.facade.create_issues_and_branches(requests)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].branch.name, "task/SSCVE-1-first")
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2].issue.key, "SSCVE-3")
+        self.assertIsNone(results[2].branch)
+        self.assertIs(results[2].error, conflict)
+
+
+if __name__ == "__main__":
+    unittest.main()